@@ -6,11 +6,12 @@ Flask web application for HeyReach performance tracking
 
 import yaml
 import os
+import argparse
 from datetime import datetime, timedelta
 from flask import Flask, render_template, jsonify, request, session, redirect
 from flask_cors import CORS
 import logging
-from heyreach_client import HeyReachClient
+from heyreach_client import HeyReachClient, get_stats_cache
 from sheets_client import SheetsClient
 from google_oauth import (
     get_authorization_url, handle_oauth_callback, 
@@ -1506,6 +1507,9 @@ def populate_sheets():
         # Initialize Sheets client with OAuth token
         try:
             sheets_client = SheetsClient(sheets_url, oauth_token=oauth_token)
+            # SheetsClient updates the token dict in place after a refresh; save it back to the session
+            if oauth_token:
+                session.modified = True
         except Exception as e:
             logger.error(f"Error initializing Sheets client: {e}")
             return jsonify({'error': f'Failed to connect to Google Sheets: {str(e)}'}), 400
@@ -1516,6 +1520,9 @@ def populate_sheets():
         if not worksheet_names:
             return jsonify({'error': 'No worksheets found in the Google Sheet'}), 400
         
+        # Read every worksheet in one batchGet instead of one request per sheet
+        sheets_client.prefetch_all_values(worksheet_names)
+        
         # Populate each worksheet
         all_results = {
             'updated': 0,
@@ -1523,29 +1530,20 @@ def populate_sheets():
             'worksheets': {}
         }
         
-        for worksheet_name in worksheet_names:
-            try:
-                logger.info(f"Populating worksheet: {worksheet_name}")
-                results = sheets_client.populate_heyreach_data(
-                    worksheet_name=worksheet_name,
-                    heyreach_data=performance_data,
-                    date_range=(start_date, end_date)
-                )
-                
-                all_results['updated'] += results['updated']
-                all_results['errors'].extend(results['errors'])
-                all_results['worksheets'][worksheet_name] = {
-                    'updated': results['updated'],
-                    'errors': results['errors']
-                }
-            except Exception as e:
-                error_msg = f"Error populating worksheet '{worksheet_name}': {str(e)}"
-                logger.error(error_msg)
-                all_results['errors'].append(error_msg)
-                all_results['worksheets'][worksheet_name] = {
-                    'updated': 0,
-                    'errors': [error_msg]
-                }
+        # Worksheets are populated concurrently (each with one batched write)
+        worksheet_results = sheets_client.populate_many(
+            worksheet_names=worksheet_names,
+            heyreach_data=performance_data,
+            date_range=(start_date, end_date)
+        )
+        
+        for worksheet_name, results in worksheet_results.items():
+            all_results['updated'] += results['updated']
+            all_results['errors'].extend(results['errors'])
+            all_results['worksheets'][worksheet_name] = {
+                'updated': results['updated'],
+                'errors': results['errors']
+            }
         
         return jsonify({
             'success': True,
@@ -1615,6 +1613,20 @@ def health_check():
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='HeyReach Performance Dashboard')
+    parser.add_argument(
+        '--refresh-stats',
+        action='store_true',
+        help='Clear cached HeyReach weekly stats before starting, so every week is fetched again'
+    )
+    args = parser.parse_args()
+    
+    if args.refresh_stats:
+        stats_cache = get_stats_cache()
+        if stats_cache is not None:
+            stats_cache.clear()
+            logger.info(f"Cleared HeyReach stats cache at {stats_cache.path}")
+    
     # Initialize client
     if not init_client():
         logger.error("Failed to initialize HeyReach client. Check your config.yaml or environment variables")
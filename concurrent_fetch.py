@@ -0,0 +1,45 @@
+"""
+Concurrent Fetch
+Bounded fan-out of independent API calls for the API clients
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Callable, Iterator, Sequence, Tuple, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+def iter_indexed_results(items: Sequence[T], fetch: Callable[[T], R],
+                         max_workers: int) -> Iterator[Tuple[int, R]]:
+    """
+    Yield (index, fetch(item)) pairs as each call completes
+    
+    At most 2 * max_workers calls are in flight at a time, so only that many results are held
+    in memory regardless of how many items there are. Results arrive in completion order;
+    sort on the index when input order matters.
+    
+    Args:
+        items: Inputs, one call each
+        fetch: Function making the call for one item
+        max_workers: Number of concurrent calls
+    
+    Yields:
+        Index into items and the result for that item
+    """
+    if not items:
+        return
+    
+    def call(index: int, item: T) -> Tuple[int, R]:
+        return index, fetch(item)
+    
+    pending_items = enumerate(items)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        in_flight = {executor.submit(call, index, item) for index, item in islice(pending_items, 2 * max_workers)}
+        while in_flight:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for index, item in islice(pending_items, len(done)):
+                in_flight.add(executor.submit(call, index, item))
+            for future in done:
+                yield future.result()
@@ -5,6 +5,7 @@ Handles OAuth 2.0 flow for Google Sheets access in SaaS mode
 
 import os
 import logging
+from datetime import datetime, timedelta
 from flask import session, redirect, request, url_for
 from google_auth_oauthlib.flow import Flow
 from google.oauth2.credentials import Credentials
@@ -15,6 +16,9 @@ logger = logging.getLogger(__name__)
 # OAuth 2.0 scopes required for Google Sheets
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
 
+# Refresh access tokens this long before they expire (google-auth itself only allows 20s)
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+
 # Default redirect URI (can be overridden)
 DEFAULT_REDIRECT_URI = os.environ.get('GOOGLE_REDIRECT_URI', 'http://localhost:5000/api/google/callback')
 
@@ -119,7 +123,9 @@ def handle_oauth_callback(code: str, state: str):
         'token_uri': creds.token_uri,
         'client_id': client_id,
         'client_secret': client_secret,
-        'scopes': creds.scopes or SCOPES
+        'scopes': creds.scopes or SCOPES,
+        # Kept so later requests can tell when the access token is about to expire
+        'expiry': creds.expiry.isoformat() if creds.expiry else None
     }
     
     session['google_oauth_token'] = token_info
@@ -149,15 +155,18 @@ def get_stored_credentials():
         token_uri=token_info.get('token_uri', 'https://oauth2.googleapis.com/token'),
         client_id=token_info.get('client_id'),
         client_secret=token_info.get('client_secret'),
-        scopes=token_info.get('scopes', SCOPES)
+        scopes=token_info.get('scopes', SCOPES),
+        expiry=datetime.fromisoformat(token_info['expiry']) if token_info.get('expiry') else None
     )
     
-    # Refresh if expired
-    if creds.expired and creds.refresh_token:
+    # Refresh if expired or about to expire (google-auth stores expiry as naive UTC)
+    expiring = creds.expiry is not None and creds.expiry - datetime.utcnow() < TOKEN_REFRESH_MARGIN
+    if (creds.expired or expiring) and creds.refresh_token:
         try:
             creds.refresh(Request())
             # Update session with new token
             token_info['token'] = creds.token
+            token_info['expiry'] = creds.expiry.isoformat() if creds.expiry else None
             session['google_oauth_token'] = token_info
         except Exception as e:
             logger.error(f"Error refreshing token: {e}")
@@ -4,12 +4,27 @@ Handles all interactions with HeyReach API for LinkedIn outreach data
 """
 
 import requests
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional
 import logging
 import json
 import gc
+import os
 import time
+import hashlib
+import sqlite3
+import atexit
+import threading
+from collections import deque
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, as_completed, wait
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -17,13 +32,267 @@ logger = logging.getLogger(__name__)
 logging.getLogger('requests').setLevel(logging.WARNING)
 logging.getLogger('urllib3').setLevel(logging.WARNING)
 
+# Shared worker pool for sender-week fetches, reused across calls instead of
+# being created and torn down per request (threads start lazily on first submit)
+_MAX_IN_FLIGHT = 3
+_fetch_executor = ThreadPoolExecutor(max_workers=_MAX_IN_FLIGHT, thread_name_prefix='heyreach')
+atexit.register(_fetch_executor.shutdown)
+
+# Weekly metric -> GetOverallStats field names to try, in priority order
+_WEEKLY_METRIC_FIELDS = (
+    ('connections_sent', ('connectionsSent', 'connectionRequestsSent')),
+    ('connections_accepted', ('connectionsAccepted', 'acceptedConnections')),
+    ('messages_sent', ('totalMessageStarted', 'messagesSent')),
+    ('message_replies', ('totalMessageReplies', 'repliesReceived')),
+    ('open_conversations', ('openConversations', 'totalMessageStarted')),
+    ('interested', ('interested', 'interestedLeads')),
+    ('leads_not_enrolled', ('leadsNotEnrolled', 'pendingLeads')),
+)
+
+# byDayStats fields summed into a week's totals when overallStats is missing
+_BY_DAY_STAT_FIELDS = (
+    'connectionsSent', 'connectionsAccepted', 'messagesSent', 'totalMessageReplies',
+    'totalMessageStarted',  # Open conversations
+    'totalInmailReplies', 'inmailMessagesSent'
+)
+
+
+def _json_loads(content):
+    """Decode a JSON response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+# Response key set -> resolved weekly metric keys (HeyReach returns the same shape every call)
+_RESOLVED_FIELDS = {}
+_RESOLVED_FIELDS_LOCK = threading.Lock()
+
+
+def _resolve_weekly_fields(stats_dict: Dict):
+    """
+    Map each weekly metric to the response keys to try, in priority order
+    
+    Resolution (exact key first, then case-insensitive) is memoized per response
+    key set, so it only runs once per distinct response shape.
+    """
+    shape = frozenset(stats_dict)
+    resolved = _RESOLVED_FIELDS.get(shape)
+    if resolved is None:
+        lower_map = {key.lower(): key for key in stats_dict}
+        resolved = tuple(
+            (metric, tuple(
+                key for key in (
+                    name if name in stats_dict else lower_map.get(name.lower())
+                    for name in field_names
+                ) if key is not None
+            ))
+            for metric, field_names in _WEEKLY_METRIC_FIELDS
+        )
+        with _RESOLVED_FIELDS_LOCK:
+            if len(_RESOLVED_FIELDS) >= 64:  # Guard against unbounded growth on odd responses
+                _RESOLVED_FIELDS.clear()
+            _RESOLVED_FIELDS[shape] = resolved
+    return resolved
+
+
+def _get_field_value(stats_dict: Dict, keys, default=0) -> int:
+    """Get the first non-None value among the resolved keys as an int (never None)"""
+    for key in keys:
+        value = stats_dict[key]
+        if value is not None:
+            try:
+                return int(float(value))
+            except (ValueError, TypeError, OverflowError):
+                return default
+    return default
+
+
+# Pulls the counters format_weeks_data needs from an extracted week in one call
+_get_formatted_counts = itemgetter(
+    'connections_sent', 'connections_accepted', 'messages_sent', 'message_replies', 'leads_not_enrolled'
+)
+
+
+def _extract_weekly_metrics(stats_dict: Dict) -> Dict:
+    """Extract weekly metrics from a GetOverallStats response"""
+    return {
+        metric: _get_field_value(stats_dict, keys)
+        for metric, keys in _resolve_weekly_fields(stats_dict)
+    }
+
+
+class TokenBucket:
+    """Thread-safe token bucket used to pace outgoing API calls"""
+    
+    def __init__(self, rate_per_sec: float, burst: int = 1):
+        """
+        Initialize token bucket
+        
+        Args:
+            rate_per_sec: Sustained number of calls allowed per second
+            burst: Maximum number of calls that may be made back-to-back
+        """
+        self.rate = rate_per_sec
+        self.burst = burst
+        self.tokens = float(burst)
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available, then consume it"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+                self.last = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            
+            # Sleep for the deficit without the lock, so record() and other callers aren't blocked,
+            # then re-check: another caller may have taken the token meanwhile
+            time.sleep(wait)
+
+
+class AdaptiveRateLimiter(TokenBucket):
+    """
+    Token bucket whose rate adapts to API health (AIMD)
+    
+    Every window the failure rate of recorded calls is checked: the rate is
+    halved when more than 10% were throttled (429/5xx) and raised by one
+    call/sec when fewer than 5% failed.
+    """
+    
+    def __init__(self, rate_per_sec: float = 10.0, burst: int = 3,
+                 min_rate: float = 1.0, max_rate: float = 20.0, window_seconds: float = 5.0):
+        """
+        Initialize adaptive rate limiter
+        
+        Args:
+            rate_per_sec: Initial calls per second
+            burst: Maximum number of calls that may be made back-to-back
+            min_rate: Lower bound for the adapted rate
+            max_rate: Upper bound for the adapted rate
+            window_seconds: How often the rate is re-evaluated
+        """
+        super().__init__(rate_per_sec, burst)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.window_seconds = window_seconds
+        self.outcomes = deque(maxlen=200)
+        self.window_start = time.monotonic()
+    
+    def record(self, success: bool):
+        """Record the outcome of an API call and adjust the rate once per window"""
+        with self.lock:
+            self.outcomes.append(success)
+            now = time.monotonic()
+            if now - self.window_start < self.window_seconds:
+                return
+            
+            failure_rate = self.outcomes.count(False) / len(self.outcomes)
+            if failure_rate > 0.10:
+                self.rate = max(self.min_rate, self.rate / 2)
+                logger.info(f"Rate limiter decreased to {self.rate:.1f} calls/sec (failure rate {failure_rate:.0%})")
+            elif failure_rate < 0.05:
+                self.rate = min(self.max_rate, self.rate + 1)
+            
+            self.outcomes.clear()
+            self.window_start = now
+
+
+# Stats cache lifetimes. A week counts as settled once it ended (UTC, matching the API window)
+# more than _STATS_SETTLED_GRACE ago; late events and timezone skew can still change it until then.
+_STATS_SETTLED_GRACE = timedelta(days=2)
+_STATS_SETTLED_TTL = 30 * 24 * 3600
+_STATS_RECENT_TTL = 3600
+
+
+class StatsCache:
+    """
+    SQLite-backed cache for GetOverallStats responses
+    
+    Settled weeks are kept for _STATS_SETTLED_TTL, recent ones for _STATS_RECENT_TTL.
+    Expired rows are purged whenever the cache is opened.
+    """
+    
+    def __init__(self, path: str):
+        """
+        Open (or create) the cache database
+        
+        Args:
+            path: Path to the SQLite cache file
+        """
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS stats (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+        )
+        # Evict expired rows, and rows from older versions that were stored without an expiry
+        self.conn.execute("DELETE FROM stats WHERE expires_at IS NULL OR expires_at < ?", (time.time(),))
+        self.conn.commit()
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """Return cached stats for key, or None if missing or expired"""
+        with self.lock:
+            row = self.conn.execute("SELECT value, expires_at FROM stats WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        value, expires_at = row
+        if expires_at is None or expires_at < time.time():
+            return None
+        return _json_loads(value)
+    
+    def set(self, key: str, value: Dict, expire: float):
+        """Store stats for key; expire is a TTL in seconds"""
+        expires_at = time.time() + expire
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO stats (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value), expires_at)
+            )
+            self.conn.commit()
+    
+    def clear(self):
+        """Drop all cached stats"""
+        with self.lock:
+            self.conn.execute("DELETE FROM stats")
+            self.conn.commit()
+
+
+_stats_cache = None
+_stats_cache_lock = threading.Lock()
+
+
+def get_stats_cache() -> Optional[StatsCache]:
+    """
+    Get the process-wide stats cache, creating it on first use
+    
+    Returns:
+        StatsCache instance, or None if the cache file can't be opened
+    """
+    global _stats_cache
+    with _stats_cache_lock:
+        if _stats_cache is None:
+            path = os.environ.get('HEYREACH_CACHE_PATH', '.heyreach_cache.db')
+            try:
+                _stats_cache = StatsCache(path)
+            except sqlite3.Error as e:
+                logger.warning(f"Stats cache disabled, could not open {path}: {e}")
+                return None
+        return _stats_cache
+
 
 class HeyReachClient:
     """Client for interacting with HeyReach API"""
     
     def __init__(self, api_key: str, base_url: str = "https://api.heyreach.io", 
                  sender_ids: List[int] = None, sender_names: Dict[int, str] = None,
-                 client_groups: Dict = None):
+                 client_groups: Dict = None, use_stats_cache: bool = True):
         """
         Initialize HeyReach client
         
@@ -33,6 +302,7 @@ class HeyReachClient:
             sender_ids: Optional list of manually configured sender IDs
             sender_names: Optional dict mapping sender IDs to names
             client_groups: Optional dict mapping client names to sender IDs
+            use_stats_cache: Reuse cached weekly stats (settled weeks for 30 days, recent ones for an hour)
         """
         self.api_key = api_key
         self.base_url = base_url.rstrip('/')
@@ -48,9 +318,6 @@ class HeyReachClient:
         self.session.headers.update(self.headers)
         
         # Configure connection pooling
-        from requests.adapters import HTTPAdapter
-        from urllib3.util.retry import Retry
-        
         # Retry strategy for transient errors
         # For 429 (rate limit), use longer backoff; for other errors, use shorter backoff
         retry_strategy = Retry(
@@ -69,6 +336,13 @@ class HeyReachClient:
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
+        # Pace GetOverallStats calls, adapting the rate to 429/5xx feedback
+        self.rate_limiter = AdaptiveRateLimiter(rate_per_sec=10.0, burst=3)
+        
+        # Weekly stats cache, namespaced per API key so workspaces never share entries
+        self.stats_cache = get_stats_cache() if use_stats_cache else None
+        self.stats_cache_namespace = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+        
         # Store working endpoints (discovered dynamically)
         self.working_endpoints = {}
         self.manual_sender_ids = sender_ids or []  # Manually configured sender IDs
@@ -107,19 +381,24 @@ class HeyReachClient:
             Response data as dictionary
         """
         url = f"{self.base_url}/{endpoint}"
-        request_headers = headers or self.headers
         
         try:
             # Use session for connection pooling and reuse
+            # Auth headers live on the session; only per-call overrides are passed here
             response = self.session.request(
                 method=method,
                 url=url,
-                headers=request_headers,
+                headers=headers,
                 params=params,
                 json=data,
                 timeout=(10, 60)  # (connect timeout, read timeout) - increased read timeout for large responses
             )
             
+            # Feed API health back to the rate limiter (urllib3 retries hide intermediate 429s)
+            retries = getattr(response.raw, 'retries', None)
+            throttled = response.status_code == 429 or response.status_code >= 500 or bool(retries and retries.history)
+            self.rate_limiter.record(success=not throttled)
+            
             # Log detailed error information for debugging
             if response.status_code != 200:
                 logger.error(f"API Error - Status: {response.status_code}, URL: {url}")
@@ -137,24 +416,23 @@ class HeyReachClient:
             # Try to parse as JSON first
             try:
                 if 'application/json' in content_type or 'text/json' in content_type:
-                    return response.json()
+                    return _json_loads(response.content)
                 elif 'text/plain' in content_type or 'text/html' in content_type:
                     # Try to parse as JSON even if content-type says text/plain
                     try:
-                        return response.json()
+                        return _json_loads(response.content)
                     except:
                         # If JSON parsing fails, try to extract JSON from text
                         text = response.text.strip()
                         # Try to find JSON in the response
                         if text.startswith('{') or text.startswith('['):
-                            import json
                             return json.loads(text)
                         else:
                             logger.warning(f"Response is text but not JSON: {text[:200]}")
                             return {}
                 else:
                     # Try JSON anyway
-                    return response.json()
+                    return _json_loads(response.content)
             except ValueError as json_error:
                 logger.error(f"Failed to parse JSON response: {json_error}")
                 logger.error(f"Response content type: {content_type}")
@@ -169,10 +447,11 @@ class HeyReachClient:
                 error_text = e.response.text[:1000] if e.response else 'No response'
                 logger.error(f"Response: {error_text}")
                 # Try to parse error response as JSON
-                if e.response:
+                # Pretty-printing the error body is only worth it when debugging
+                if e.response and logger.isEnabledFor(logging.DEBUG):
                     try:
-                        error_json = e.response.json()
-                        logger.error(f"Error JSON: {json.dumps(error_json, indent=2)}")
+                        error_json = _json_loads(e.response.content)
+                        logger.debug(f"Error JSON: {json.dumps(error_json, indent=2)}")
                     except:
                         pass
             except:
@@ -180,6 +459,7 @@ class HeyReachClient:
             return {}
         except requests.exceptions.RequestException as e:
             logger.error(f"HeyReach API error: {e}")
+            self.rate_limiter.record(success=False)
             return {}
     
     def get_campaigns(self) -> List[Dict]:
@@ -469,6 +749,7 @@ class HeyReachClient:
                                 logger.info(f"✅ Successfully fetched {len(items)} accounts from: {endpoint}")
                                 self.working_endpoints['linkedin_accounts'] = endpoint
                                 self.headers = headers
+                                self.session.headers.update(headers)
                                 # Map account IDs to names from config.yaml
                                 mapped_accounts = []
                                 for account in items:
@@ -495,6 +776,7 @@ class HeyReachClient:
                                 logger.info(f"✅ Successfully fetched {len(items)} accounts from: {endpoint}")
                                 self.working_endpoints['linkedin_accounts'] = endpoint
                                 self.headers = headers
+                                self.session.headers.update(headers)
                                 # Map account IDs to names from config.yaml
                                 mapped_accounts = []
                                 for account in items:
@@ -519,6 +801,7 @@ class HeyReachClient:
                         logger.info(f"✅ Successfully fetched {len(data)} accounts from: {endpoint}")
                         self.working_endpoints['linkedin_accounts'] = endpoint
                         self.headers = headers
+                        self.session.headers.update(headers)
                         # Map account IDs to names from config.yaml
                         mapped_accounts = []
                         for account in data:
@@ -929,7 +1212,7 @@ class HeyReachClient:
         Returns:
             Dictionary with overall stats
         """
-        logger.info(f"Fetching overall stats from GetOverallStats endpoint...")
+        logger.info("Fetching overall stats from GetOverallStats endpoint...")
         
         endpoint = "api/public/stats/GetOverallStats"
         
@@ -967,13 +1250,15 @@ class HeyReachClient:
             "endDate": end_date
         }
         
-        logger.info(f"📡 GetOverallStats API Request: accountIds={processed_account_ids} (type: {[type(x).__name__ for x in processed_account_ids]}), campaignIds={processed_campaign_ids}, startDate={start_date}, endDate={end_date}")
+        # Called once per sender-week: only build the type list when INFO is actually emitted
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("📡 GetOverallStats API Request: accountIds=%s (type: %s), campaignIds=%s, startDate=%s, endDate=%s",
+                        processed_account_ids, [type(x).__name__ for x in processed_account_ids],
+                        processed_campaign_ids, start_date, end_date)
         
         # Set headers according to HeyReach API documentation
-        # The API documentation specifies Accept: text/plain
+        # The API documentation specifies Accept: text/plain; the session supplies X-API-KEY
         headers = {
-            "X-API-KEY": self.api_key,
-            "Content-Type": "application/json",
             "Accept": "text/plain"  # API docs specify text/plain
         }
         
@@ -981,14 +1266,14 @@ class HeyReachClient:
             response_data = self._make_request(endpoint, method="POST", data=request_data, headers=headers)
             
             # Log response for debugging
-            if response_data:
-                logger.debug(f"GetOverallStats raw response type: {type(response_data).__name__}")
+            if response_data and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("GetOverallStats raw response type: %s", type(response_data).__name__)
                 if isinstance(response_data, dict):
-                    logger.debug(f"GetOverallStats raw response keys: {list(response_data.keys())}")
+                    logger.debug("GetOverallStats raw response keys: %s", list(response_data.keys()))
                 elif isinstance(response_data, list):
-                    logger.debug(f"GetOverallStats raw response is a list with {len(response_data)} items")
+                    logger.debug("GetOverallStats raw response is a list with %d items", len(response_data))
                 else:
-                    logger.debug(f"GetOverallStats raw response: {str(response_data)[:200]}")
+                    logger.debug("GetOverallStats raw response: %s", str(response_data)[:200])
             
             # Process response - HeyReach API returns {byDayStats: {...}, overallStats: {...}}
             # We want to use overallStats for aggregated weekly data, or aggregate byDayStats
@@ -999,36 +1284,23 @@ class HeyReachClient:
                 if 'overallStats' in data and isinstance(data['overallStats'], dict) and len(data['overallStats']) > 0:
                     logger.debug("Found 'overallStats' - using aggregated data")
                     data = data['overallStats']
-                    logger.info(f"Using overallStats with keys: {list(data.keys())}")
+                    logger.info("Using overallStats with keys: %s", list(data))
                 # If no overallStats or it's empty, we need to aggregate from byDayStats
                 elif 'byDayStats' in data and isinstance(data['byDayStats'], dict):
                     logger.debug("Found 'byDayStats' - will aggregate daily data")
                     # Aggregate daily stats for the week
                     by_day_stats = data['byDayStats']
+                    # Sum up all daily stats, one generator per field
+                    day_stats_list = [day_stats for day_stats in by_day_stats.values() if isinstance(day_stats, dict)]
+                    days_counted = len(day_stats_list)
                     aggregated = {
-                        'connectionsSent': 0,
-                        'connectionsAccepted': 0,
-                        'messagesSent': 0,
-                        'totalMessageReplies': 0,
-                        'totalMessageStarted': 0,  # Open conversations
-                        'totalInmailReplies': 0,
-                        'inmailMessagesSent': 0
+                        field: sum(int(day_stats.get(field) or 0) for day_stats in day_stats_list)
+                        for field in _BY_DAY_STAT_FIELDS
                     }
                     
-                    # Sum up all daily stats
-                    days_counted = 0
-                    for date_key, day_stats in by_day_stats.items():
-                        if isinstance(day_stats, dict):
-                            days_counted += 1
-                            aggregated['connectionsSent'] += int(day_stats.get('connectionsSent', 0) or 0)
-                            aggregated['connectionsAccepted'] += int(day_stats.get('connectionsAccepted', 0) or 0)
-                            aggregated['messagesSent'] += int(day_stats.get('messagesSent', 0) or 0)
-                            aggregated['totalMessageReplies'] += int(day_stats.get('totalMessageReplies', 0) or 0)
-                            aggregated['totalMessageStarted'] += int(day_stats.get('totalMessageStarted', 0) or 0)
-                            aggregated['totalInmailReplies'] += int(day_stats.get('totalInmailReplies', 0) or 0)
-                            aggregated['inmailMessagesSent'] += int(day_stats.get('inmailMessagesSent', 0) or 0)
-                    
-                    logger.info(f"Aggregated stats from {days_counted} days in byDayStats: connectionsSent={aggregated['connectionsSent']}, connectionsAccepted={aggregated['connectionsAccepted']}, totalMessageStarted={aggregated['totalMessageStarted']} (messages_sent), totalMessageReplies={aggregated['totalMessageReplies']}")
+                    logger.info("Aggregated stats from %d days in byDayStats: connectionsSent=%s, connectionsAccepted=%s, totalMessageStarted=%s (messages_sent), totalMessageReplies=%s",
+                                days_counted, aggregated['connectionsSent'], aggregated['connectionsAccepted'],
+                                aggregated['totalMessageStarted'], aggregated['totalMessageReplies'])
                     data = aggregated
                 # Try other nested structures as fallback
                 elif 'data' in data and isinstance(data['data'], dict):
@@ -1041,22 +1313,24 @@ class HeyReachClient:
                     logger.debug("Response has nested 'stats' key, using that")
                     data = data['stats']
             elif isinstance(data, list) and len(data) > 0:
-                logger.debug(f"Response is a list with {len(data)} items")
+                logger.debug("Response is a list with %d items", len(data))
                 if isinstance(data[0], dict):
                     data = data[0]
             
             # Log final processed structure
             if isinstance(data, dict):
-                logger.debug(f"Final processed response keys: {list(data.keys())}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Final processed response keys: %s", list(data.keys()))
                 # Log key metrics
                 if 'connectionsSent' in data or 'connectionsAccepted' in data:
-                    logger.info(f"Final key metrics: connectionsSent={data.get('connectionsSent', 0)}, connectionsAccepted={data.get('connectionsAccepted', 0)}, totalMessageStarted={data.get('totalMessageStarted', 0)} (messages_sent), totalMessageReplies={data.get('totalMessageReplies', 0)}")
+                    logger.info("Final key metrics: connectionsSent=%s, connectionsAccepted=%s, totalMessageStarted=%s (messages_sent), totalMessageReplies=%s",
+                                data.get('connectionsSent', 0), data.get('connectionsAccepted', 0),
+                                data.get('totalMessageStarted', 0), data.get('totalMessageReplies', 0))
             
             return data if data else {}
         except Exception as e:
-            logger.error(f"Error fetching overall stats: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            # Can fire once per sender-week during rate-limit storms; only format the traceback at DEBUG
+            logger.error("Error fetching overall stats: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return {}
     
     def get_sender_weekly_performance(self, sender_id: str = None, start_date: str = None, 
@@ -1065,7 +1339,7 @@ class HeyReachClient:
         Get weekly performance data for a specific sender or all senders using GetOverallStats API
         
         MEMORY-OPTIMIZED for Render free plan (512MB RAM limit):
-        - Uses sequential batch processing instead of parallel ThreadPoolExecutor
+        - Keeps at most a few requests in flight instead of submitting every task at once
         - Processes results immediately and clears raw data
         - Explicit garbage collection between batches
         
@@ -1189,27 +1463,17 @@ class HeyReachClient:
             current_week_start = current_week_start + timedelta(days=7)
             week_count += 1
         
-        # Store week objects by key for later formatting
-        week_objects_by_key = {week['key']: week for week in weeks}
+        # Precompute display strings per week: (Saturday start, Friday end)
+        # week_end is ALWAYS the Friday, regardless of the user's date range
+        week_strs = {
+            week['key']: ((week['friday'] - timedelta(days=6)).strftime('%Y-%m-%d'), week['key'])
+            for week in weeks
+        }
         
         # MEMORY-EFFICIENT: Use simple dict instead of defaultdict
         # Store only final processed data, not raw API responses
         sender_weekly_data = {}
         
-        def get_field_value(stats_dict, *field_names, default=0):
-            """Get field value, trying multiple field names"""
-            if not isinstance(stats_dict, dict):
-                return default
-            for field_name in field_names:
-                if field_name in stats_dict:
-                    value = stats_dict[field_name]
-                    if value is not None:
-                        try:
-                            return float(value) if isinstance(value, (int, float, str)) else default
-                        except (ValueError, TypeError):
-                            return default
-            return default
-        
         def get_sender_name(account):
             """Get sender name with proper fallback"""
             account_id = account.get('id')
@@ -1226,92 +1490,136 @@ class HeyReachClient:
                 sender_name = f"Sender {account_id}"
             return sender_name, account_id_int if account_id_int else account_id
         
+        # Weeks ending on or before this UTC date are settled (see _STATS_SETTLED_GRACE)
+        settled_before = (datetime.now(timezone.utc) - _STATS_SETTLED_GRACE).date()
+        
+        def get_cache_key(api_account_id, week):
+            """Cache key for one sender-week (uses the effective, possibly capped, range)"""
+            return (f"{self.stats_cache_namespace}:{api_account_id}:"
+                    f"{week['start'].strftime('%Y-%m-%d')}:{week['end'].strftime('%Y-%m-%d')}")
+        
+        def get_cached_stats(account, week):
+            """Return (sender_name, week, stats) from the cache, or None on a miss"""
+            if self.stats_cache is None:
+                return None
+            sender_name, api_account_id = get_sender_name(account)
+            try:
+                stats = self.stats_cache.get(get_cache_key(api_account_id, week))
+            except Exception as e:
+                # A locked or corrupt cache file must not fail the fetch; treat it as a miss
+                logger.warning("Stats cache read failed for %s: %s", sender_name, e)
+                return None
+            if stats is None:
+                return None
+            return sender_name, week, stats
+        
+        def fetch_sender_week_stats(account, week):
+            """Fetch GetOverallStats for one sender-week (runs on a worker thread)"""
+            sender_name, api_account_id = get_sender_name(account)
+            
+            week_start_iso = week['start'].strftime('%Y-%m-%dT00:00:00.000Z')
+            week_end_iso = week['end'].strftime('%Y-%m-%dT23:59:59.999Z')
+            
+            # Make API call with retry logic
+            stats = None
+            max_retries = 2  # Reduced retries for speed
+            
+            for attempt in range(max_retries):
+                try:
+                    # First attempt was paced at submission; retries take their own token
+                    if attempt > 0:
+                        self.rate_limiter.acquire()
+                    stats = self.get_overall_stats(
+                        account_ids=[api_account_id],
+                        campaign_ids=[],
+                        start_date=week_start_iso,
+                        end_date=week_end_iso
+                    )
+                    break
+                except Exception as e:
+                    error_str = str(e)
+                    if '429' in error_str or 'rate limit' in error_str.lower():
+                        # Back off through the adaptive limiter instead of a fixed sleep
+                        self.rate_limiter.record(success=False)
+                        if attempt < max_retries - 1:
+                            continue
+                    logger.warning(f"API error for {sender_name}: {str(e)[:100]}")
+                    stats = {}
+                    break
+            
+            # Settled weeks rarely change; recent ones may still receive late events
+            if stats and isinstance(stats, dict) and self.stats_cache is not None:
+                is_settled = week['end'].date() <= settled_before
+                try:
+                    self.stats_cache.set(get_cache_key(api_account_id, week), stats,
+                                         expire=_STATS_SETTLED_TTL if is_settled else _STATS_RECENT_TTL)
+                except Exception as e:
+                    # The live result is still returned when the cache can't be written
+                    logger.warning("Stats cache write failed for %s: %s", sender_name, e)
+            
+            return sender_name, week, stats
+        
         # Create task list
         tasks = [(account, week) for account in linkedin_accounts for week in weeks]
         total_tasks = len(tasks)
         
-        logger.info(f"Processing {total_tasks} sender-week combinations (memory-optimized sequential mode)...")
-        
-        # MEMORY-OPTIMIZED: Process in small sequential batches
-        # Instead of ThreadPoolExecutor which creates all futures at once
-        batch_size = 3  # Very small batches for memory efficiency
+        # MEMORY-OPTIMIZED: Bound the number of in-flight requests
+        # Only max_in_flight raw responses exist at once; each is reduced to metrics on arrival
+        max_in_flight = _MAX_IN_FLIGHT
+        batch_size = 3  # Garbage-collect after this many processed results
         completed = 0
         first_result_logged = False
-        rate_limit_errors = 0
-        base_delay = 0.1  # Base delay between API calls (seconds)
+        log_progress = logger.isEnabledFor(logging.INFO)
         
-        for i in range(0, total_tasks, batch_size):
-            batch = tasks[i:i + batch_size]
+        logger.info(f"Processing {total_tasks} sender-week combinations ({max_in_flight} in flight)...")
+        
+        def process_result(result):
+            """Reduce a finished fetch to its weekly metrics"""
+            nonlocal completed, first_result_logged
+            completed += 1
+            sender_name, week, stats = result
             
-            for account, week in batch:
-                completed += 1
-                sender_name, api_account_id = get_sender_name(account)
-                
-                week_start_iso = week['start'].strftime('%Y-%m-%dT00:00:00.000Z')
-                week_end_iso = week['end'].strftime('%Y-%m-%dT23:59:59.999Z')
-                
-                # Make API call with retry logic
-                stats = None
-                max_retries = 2  # Reduced retries for speed
-                
-                for attempt in range(max_retries):
-                    try:
-                        stats = self.get_overall_stats(
-                            account_ids=[api_account_id],
-                            campaign_ids=[],
-                            start_date=week_start_iso,
-                            end_date=week_end_iso
-                        )
-                        rate_limit_errors = max(0, rate_limit_errors - 1)
-                        break
-                    except Exception as e:
-                        error_str = str(e)
-                        if '429' in error_str or 'rate limit' in error_str.lower():
-                            rate_limit_errors += 1
-                            if attempt < max_retries - 1:
-                                wait_time = base_delay * (2 ** (attempt + rate_limit_errors))
-                                wait_time = min(wait_time, 5.0)  # Cap at 5 seconds
-                                time.sleep(wait_time)
-                                continue
-                        logger.warning(f"API error for {sender_name}: {str(e)[:100]}")
-                        stats = {}
-                        break
-                
-                # Log first result structure
-                if not first_result_logged and stats and isinstance(stats, dict) and len(stats) > 0:
-                    logger.info(f"📊 First API response keys: {list(stats.keys())}")
-                    first_result_logged = True
-                
-                # MEMORY-EFFICIENT: Process and store only essential data immediately
-                if stats and isinstance(stats, dict):
-                    if sender_name not in sender_weekly_data:
-                        sender_weekly_data[sender_name] = {}
-                    
-                    sender_weekly_data[sender_name][week['key']] = {
-                        'connections_sent': get_field_value(stats, 'connectionsSent', 'connectionRequestsSent'),
-                        'connections_accepted': get_field_value(stats, 'connectionsAccepted', 'acceptedConnections'),
-                        'messages_sent': get_field_value(stats, 'totalMessageStarted', 'messagesSent'),
-                        'message_replies': get_field_value(stats, 'totalMessageReplies', 'repliesReceived'),
-                        'open_conversations': get_field_value(stats, 'openConversations', 'totalMessageStarted'),
-                        'interested': get_field_value(stats, 'interested', 'interestedLeads'),
-                        'leads_not_enrolled': get_field_value(stats, 'leadsNotEnrolled', 'pendingLeads')
-                    }
-                
-                # Clear the stats dict reference
-                stats = None
-                
-                # Small delay to avoid rate limiting
-                if rate_limit_errors > 3:
-                    time.sleep(base_delay * 2)
-                else:
-                    time.sleep(base_delay)
+            # Log first result structure
+            if not first_result_logged and stats and isinstance(stats, dict) and len(stats) > 0:
+                logger.info(f"📊 First API response keys: {list(stats.keys())}")
+                first_result_logged = True
+            
+            # MEMORY-EFFICIENT: Process and store only essential data immediately
+            if stats and isinstance(stats, dict):
+                if sender_name not in sender_weekly_data:
+                    sender_weekly_data[sender_name] = {}
                 
-                # Log progress every 20 tasks
-                if completed % 20 == 0 or completed == total_tasks:
-                    logger.info(f"Processed {completed}/{total_tasks} API calls...")
+                sender_weekly_data[sender_name][week['key']] = _extract_weekly_metrics(stats)
+            
+            # Log progress every 20 tasks
+            if log_progress and (completed % 20 == 0 or completed == total_tasks):
+                logger.info("Processed %d/%d API calls...", completed, total_tasks)
             
             # CRITICAL: Force garbage collection after each batch
-            gc.collect()
+            if completed % batch_size == 0:
+                gc.collect()
+        
+        in_flight = set()
+        for account, week in tasks:
+            # Cache hits skip the executor and the rate limiter entirely
+            cached = get_cached_stats(account, week)
+            if cached is not None:
+                process_result(cached)
+                continue
+            
+            # Admission gate: wait for a slot before submitting the next task
+            if len(in_flight) >= max_in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    process_result(future.result())
+            # Pace submissions so bursts of completions can't turn into bursts of requests
+            self.rate_limiter.acquire()
+            in_flight.add(_fetch_executor.submit(fetch_sender_week_stats, account, week))
+        
+        for future in as_completed(in_flight):
+            process_result(future.result())
+        
+        gc.collect()
         
         logger.info(f"Completed processing all {total_tasks} sender-week combinations")
         
@@ -1324,50 +1632,35 @@ class HeyReachClient:
         }
         
         # Helper function to format weeks data
-        def format_weeks_data(weekly_data_dict, week_objects_dict=None):
+        def format_weeks_data(weekly_data_dict, week_strs_dict=None):
             """Format weekly data into the response format"""
             sorted_weeks = sorted(weekly_data_dict.keys())
             formatted_weeks = []
             for week_key in sorted_weeks:
-                week_data = weekly_data_dict[week_key]
-                connections_sent = week_data.get('connections_sent', 0) or 0
-                connections_accepted = week_data.get('connections_accepted', 0) or 0
-                messages_sent = week_data.get('messages_sent', 0) or 0
-                message_replies = week_data.get('message_replies', 0) or 0
+                # Extracted metrics are always ints, so no None/float fallbacks are needed
+                (connections_sent, connections_accepted, messages_sent,
+                 message_replies, leads_not_enrolled) = _get_formatted_counts(weekly_data_dict[week_key])
                 
                 acceptance_rate = (connections_accepted / connections_sent * 100) if connections_sent > 0 else 0
                 reply_rate = (message_replies / messages_sent * 100) if messages_sent > 0 else 0
                 
                 # week_key is ALWAYS the Friday date (end of Sat-Fri week)
-                # Use this for display regardless of user's date range
-                week_end_str = week_key  # Friday - ALWAYS use this for display
-                week_start_str = week_key  # Default
-                
-                if week_objects_dict and week_key in week_objects_dict:
-                    week_obj = week_objects_dict[week_key]
-                    # Use the actual Saturday start for week_start
-                    # But ALWAYS use the Friday for week_end (for display)
-                    if 'friday' in week_obj:
-                        week_start_str = (week_obj['friday'] - timedelta(days=6)).strftime('%Y-%m-%d')
-                        week_end_str = week_obj['friday'].strftime('%Y-%m-%d')
-                    else:
-                        week_start_str = week_obj['start'].strftime('%Y-%m-%d')
-                        week_end_str = week_key  # Fallback to key which is Friday
+                week_start_str, week_end_str = (week_strs_dict or {}).get(week_key, (week_key, week_key))
                 
                 formatted_weeks.append({
                     'week_start': week_start_str,  # Saturday (start of Sat-Fri week)
                     'week_end': week_end_str,      # Friday (end of Sat-Fri week) - ALWAYS the Friday
-                    'connections_sent': int(connections_sent),
-                    'connections_accepted': int(connections_accepted),
+                    'connections_sent': connections_sent,
+                    'connections_accepted': connections_accepted,
                     'acceptance_rate': round(acceptance_rate, 2),
-                    'messages_sent': int(messages_sent),
-                    'message_replies': int(message_replies),
+                    'messages_sent': messages_sent,
+                    'message_replies': message_replies,
                     'reply_rate': round(reply_rate, 2),
                     # open_conversations and interested default to 0 unless Supabase/AI is configured
                     # These will be populated from Supabase AI evaluation if configured
                     'open_conversations': 0,  # Default to 0, will be updated from Supabase if configured
                     'interested': 0,  # Default to 0, will be updated from Supabase if configured
-                    'leads_not_enrolled': int(week_data.get('leads_not_enrolled', 0) or 0)
+                    'leads_not_enrolled': leads_not_enrolled
                 })
             return formatted_weeks
         
@@ -1375,16 +1668,17 @@ class HeyReachClient:
         senders_by_client = {}
         senders_without_client = []
         
+        # Build sender name -> client lookup once (first account with a client wins)
+        name_to_client = {}
+        for account in linkedin_accounts:
+            account_client = self.sender_to_client.get(account.get('id'))
+            if account_client:
+                account_name = account.get('linkedInUserListName') or account.get('name')
+                name_to_client.setdefault(account_name, account_client)
+        
         for sender_name, weekly_data in sender_weekly_data.items():
             # Find which client this sender belongs to
-            sender_client = None
-            for account in linkedin_accounts:
-                account_name = account.get('linkedInUserListName') or account.get('name')
-                if account_name == sender_name:
-                    account_id = account.get('id')
-                    sender_client = self.sender_to_client.get(account_id)
-                    if sender_client:
-                        break
+            sender_client = name_to_client.get(sender_name)
             
             if sender_client:
                 if sender_client not in senders_by_client:
@@ -1398,7 +1692,7 @@ class HeyReachClient:
             result['clients'][client_name] = {}
             
             for sender_name, weekly_data in client_senders.items():
-                formatted_weeks = format_weeks_data(weekly_data, week_objects_by_key)
+                formatted_weeks = format_weeks_data(weekly_data, week_strs)
                 result['clients'][client_name][sender_name] = formatted_weeks
                 # Also add to main senders dict for backward compatibility
                 # Only add if not already present (to avoid duplicates)
@@ -1407,7 +1701,7 @@ class HeyReachClient:
         
         # Process senders without a client
         for sender_name, weekly_data in senders_without_client:
-            result['senders'][sender_name] = format_weeks_data(weekly_data, week_objects_by_key)
+            result['senders'][sender_name] = format_weeks_data(weekly_data, week_strs)
         
         # MEMORY CLEANUP: Clear intermediate data structures
         sender_weekly_data.clear()
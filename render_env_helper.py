@@ -16,96 +16,99 @@ def format_for_render():
         
         heyreach_config = config.get('heyreach', {})
         
-        print("=" * 80)
-        print("ENVIRONMENT VARIABLES FOR RENDER.COM")
-        print("=" * 80)
-        print()
-        print("Copy each variable below and add it to Render.com:")
-        print("  1. Go to your service on Render.com")
-        print("  2. Click 'Environment' in the sidebar")
-        print("  3. Click 'Add Environment Variable'")
-        print("  4. Paste the KEY and VALUE from below")
-        print()
-        print("-" * 80)
-        print()
+        # Collect output and emit it with a single write
+        lines = []
+        lines.append("=" * 80)
+        lines.append("ENVIRONMENT VARIABLES FOR RENDER.COM")
+        lines.append("=" * 80)
+        lines.append("")
+        lines.append("Copy each variable below and add it to Render.com:")
+        lines.append("  1. Go to your service on Render.com")
+        lines.append("  2. Click 'Environment' in the sidebar")
+        lines.append("  3. Click 'Add Environment Variable'")
+        lines.append("  4. Paste the KEY and VALUE from below")
+        lines.append("")
+        lines.append("-" * 80)
+        lines.append("")
         
         # API Key
         api_key = heyreach_config.get('api_key', '')
         if api_key:
-            print("VARIABLE 1: HEYREACH_API_KEY")
-            print("-" * 80)
-            print(f"KEY:   HEYREACH_API_KEY")
-            print(f"VALUE: {api_key}")
-            print()
+            lines.append("VARIABLE 1: HEYREACH_API_KEY")
+            lines.append("-" * 80)
+            lines.append(f"KEY:   HEYREACH_API_KEY")
+            lines.append(f"VALUE: {api_key}")
+            lines.append("")
         
         # Base URL
         base_url = heyreach_config.get('base_url', 'https://api.heyreach.io')
-        print("VARIABLE 2: HEYREACH_BASE_URL")
-        print("-" * 80)
-        print(f"KEY:   HEYREACH_BASE_URL")
-        print(f"VALUE: {base_url}")
-        print()
+        lines.append("VARIABLE 2: HEYREACH_BASE_URL")
+        lines.append("-" * 80)
+        lines.append(f"KEY:   HEYREACH_BASE_URL")
+        lines.append(f"VALUE: {base_url}")
+        lines.append("")
         
         # Sender IDs
         sender_ids = heyreach_config.get('sender_ids', [])
         if sender_ids:
             sender_ids_json = json.dumps(sender_ids)
-            print("VARIABLE 3: HEYREACH_SENDER_IDS")
-            print("-" * 80)
-            print(f"KEY:   HEYREACH_SENDER_IDS")
-            print(f"VALUE: {sender_ids_json}")
-            print(f"      (This is a JSON array with {len(sender_ids)} sender IDs)")
-            print()
+            lines.append("VARIABLE 3: HEYREACH_SENDER_IDS")
+            lines.append("-" * 80)
+            lines.append(f"KEY:   HEYREACH_SENDER_IDS")
+            lines.append(f"VALUE: {sender_ids_json}")
+            lines.append(f"      (This is a JSON array with {len(sender_ids)} sender IDs)")
+            lines.append("")
         
         # Sender Names
         sender_names = heyreach_config.get('sender_names', {})
         if sender_names:
             sender_names_json = json.dumps(sender_names)
-            print("VARIABLE 4: HEYREACH_SENDER_NAMES")
-            print("-" * 80)
-            print(f"KEY:   HEYREACH_SENDER_NAMES")
-            print(f"VALUE: {sender_names_json}")
-            print(f"      (This is a JSON object with {len(sender_names)} sender names)")
-            print()
+            lines.append("VARIABLE 4: HEYREACH_SENDER_NAMES")
+            lines.append("-" * 80)
+            lines.append(f"KEY:   HEYREACH_SENDER_NAMES")
+            lines.append(f"VALUE: {sender_names_json}")
+            lines.append(f"      (This is a JSON object with {len(sender_names)} sender names)")
+            lines.append("")
         
         # Client Groups
         client_groups = heyreach_config.get('client_groups', {})
         if client_groups:
             client_groups_json = json.dumps(client_groups)
-            print("VARIABLE 5: HEYREACH_CLIENT_GROUPS")
-            print("-" * 80)
-            print(f"KEY:   HEYREACH_CLIENT_GROUPS")
-            print(f"VALUE: {client_groups_json}")
-            print(f"      (This is a JSON object with {len(client_groups)} client groups)")
-            print()
+            lines.append("VARIABLE 5: HEYREACH_CLIENT_GROUPS")
+            lines.append("-" * 80)
+            lines.append(f"KEY:   HEYREACH_CLIENT_GROUPS")
+            lines.append(f"VALUE: {client_groups_json}")
+            lines.append(f"      (This is a JSON object with {len(client_groups)} client groups)")
+            lines.append("")
         
-        print("=" * 80)
-        print()
-        print("TIPS:")
-        print("- Copy the entire VALUE line (everything after 'VALUE:')")
-        print("- Don't add extra quotes - Render handles that automatically")
-        print("- For long JSON values, copy the entire line carefully")
-        print("- After adding all variables, Render will automatically redeploy")
-        print()
-        print("Full values also saved to 'render_env_values.txt' for reference")
-        print()
+        lines.append("=" * 80)
+        lines.append("")
+        lines.append("TIPS:")
+        lines.append("- Copy the entire VALUE line (everything after 'VALUE:')")
+        lines.append("- Don't add extra quotes - Render handles that automatically")
+        lines.append("- For long JSON values, copy the entire line carefully")
+        lines.append("- After adding all variables, Render will automatically redeploy")
+        lines.append("")
+        lines.append("Full values also saved to 'render_env_values.txt' for reference")
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
         
-        # Save to separate file for easy reference
+        # Save to separate file for easy reference (single write)
+        parts = ["Environment Variables for Render.com\n", "=" * 80 + "\n\n"]
+        if api_key:
+            parts.append(f"HEYREACH_API_KEY={api_key}\n\n")
+        parts.append(f"HEYREACH_BASE_URL={base_url}\n\n")
+        if sender_ids:
+            parts.append(f"HEYREACH_SENDER_IDS={sender_ids_json}\n\n")
+        if sender_names:
+            parts.append(f"HEYREACH_SENDER_NAMES={sender_names_json}\n\n")
+        if client_groups:
+            parts.append(f"HEYREACH_CLIENT_GROUPS={client_groups_json}\n")
         with open('render_env_values.txt', 'w') as f:
-            f.write("Environment Variables for Render.com\n")
-            f.write("=" * 80 + "\n\n")
-            if api_key:
-                f.write(f"HEYREACH_API_KEY={api_key}\n\n")
-            f.write(f"HEYREACH_BASE_URL={base_url}\n\n")
-            if sender_ids:
-                f.write(f"HEYREACH_SENDER_IDS={sender_ids_json}\n\n")
-            if sender_names:
-                f.write(f"HEYREACH_SENDER_NAMES={sender_names_json}\n\n")
-            if client_groups:
-                f.write(f"HEYREACH_CLIENT_GROUPS={client_groups_json}\n")
+            f.write(''.join(parts))
         
-        print(f"[OK] Generated formatted environment variables")
-        print(f"[OK] Saved full values to render_env_values.txt")
+        sys.stdout.write("[OK] Generated formatted environment variables\n"
+                         "[OK] Saved full values to render_env_values.txt\n")
         
         return True
         
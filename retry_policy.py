@@ -0,0 +1,25 @@
+"""
+Retry Policy
+Shared retry settings for the Smartlead and Google Sheets API clients
+"""
+
+import random
+from typing import Optional
+
+# Responses worth retrying (rate limit and transient server errors), with jittered exponential
+# backoff: min(cap, base * 2**attempt) + jitter seconds, or the server's Retry-After
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+RETRY_ATTEMPTS = 6
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 60.0
+RETRY_JITTER = 1.0
+
+
+def backoff_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Seconds to wait before retry number attempt (0-based), honoring a numeric Retry-After header"""
+    if retry_after:
+        try:
+            return min(RETRY_MAX_DELAY, float(retry_after))
+        except ValueError:
+            pass
+    return min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt) + random.uniform(0, RETRY_JITTER)
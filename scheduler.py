@@ -19,6 +19,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+WEEKDAYS = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+
 
 def load_config():
     """Load configuration from config.yaml"""
@@ -72,20 +74,13 @@ def setup_schedule(frequency: str = None, time_str: str = None, day: str = None)
         logger.info(f"📅 Scheduled daily reports at {time_str}")
         
     elif frequency == 'weekly':
-        if day.lower() == 'monday':
-            schedule.every().monday.at(time_str).do(job_wrapper)
-        elif day.lower() == 'tuesday':
-            schedule.every().tuesday.at(time_str).do(job_wrapper)
-        elif day.lower() == 'wednesday':
-            schedule.every().wednesday.at(time_str).do(job_wrapper)
-        elif day.lower() == 'thursday':
-            schedule.every().thursday.at(time_str).do(job_wrapper)
-        elif day.lower() == 'friday':
-            schedule.every().friday.at(time_str).do(job_wrapper)
-        elif day.lower() == 'saturday':
-            schedule.every().saturday.at(time_str).do(job_wrapper)
-        elif day.lower() == 'sunday':
-            schedule.every().sunday.at(time_str).do(job_wrapper)
+        day_name = day.lower()
+        if day_name not in WEEKDAYS:
+            logger.error(f"Invalid weekly day: {day}")
+            sys.exit(1)
+        
+        # schedule exposes each weekday as an attribute of the job builder
+        getattr(schedule.every(), day_name).at(time_str).do(job_wrapper)
         
         logger.info(f"📅 Scheduled weekly reports every {day.capitalize()} at {time_str}")
         
@@ -108,8 +103,15 @@ def run_scheduler():
     
     try:
         while True:
+            # Sleep until the next job is due instead of polling every minute
+            # (capped so clock changes and newly added jobs are still picked up)
+            idle = schedule.idle_seconds()
+            if idle is None:
+                time.sleep(300)  # No jobs scheduled
+                continue
+            if idle > 0:
+                time.sleep(min(idle, 300))
             schedule.run_pending()
-            time.sleep(60)  # Check every minute
             
     except KeyboardInterrupt:
         logger.info("\n🛑 Scheduler stopped by user")
@@ -135,7 +137,7 @@ def main():
     
     parser.add_argument(
         '--day',
-        choices=['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday'],
+        choices=WEEKDAYS,
         help='Day of week for weekly reports (default: from config.yaml)'
     )
     
@@ -7,26 +7,57 @@ Verifies all API connections and configurations
 import yaml
 import os
 import sys
-from src import (
-    HeyReachClient,
-    SmartleadClient,
-    GoogleSheetsHandler,
-    EmailSender
-)
+import io
+import json
+import time
+import hashlib
+import argparse
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml C parser
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
+# Fail fast on unreachable endpoints instead of stalling setup
+HTTP_PROBE_TIMEOUT = (3, 5)  # (connect, read) seconds
+SMTP_PROBE_TIMEOUT = 5
+
+CONFIG_FILE = 'config.yaml'
+
+# Successful probes are remembered per config subtree so unchanged credentials aren't re-checked
+SETUP_CACHE_FILE = './reports/.setup_cache.json'
+SETUP_CACHE_TTL = 12 * 60 * 60  # seconds
+
+# Template values shipped in config.yaml that mean "not configured yet"
+_PLACEHOLDERS = frozenset({
+    "YOUR_HEYREACH_API_KEY_HERE",
+    "YOUR_SMARTLEAD_API_KEY_HERE",
+    "YOUR_GOOGLE_SHEET_ID_HERE",
+    "YOUR_APP_PASSWORD_HERE"
+})
+
+# Marks an argument that wasn't passed (None is a meaningful value)
+_UNSET = object()
+
 
 def load_config():
     """Load configuration from config.yaml"""
     try:
-        with open('config.yaml', 'r') as f:
-            config = yaml.safe_load(f)
-        return config
+        with open(CONFIG_FILE, 'rb') as f:
+            return yaml.load(f, Loader=_YamlLoader)
     except FileNotFoundError:
         print("❌ Error: config.yaml not found!")
         print("Please create config.yaml from the template and add your API keys.")
         sys.exit(1)
-    except Exception as e:
-        print(f"❌ Error loading config: {e}")
-        sys.exit(1)
 
 def test_heyreach(config):
     """Test HeyReach API connection"""
@@ -35,13 +66,16 @@ def test_heyreach(config):
     heyreach_config = config.get('heyreach', {})
     api_key = heyreach_config.get('api_key')
     
-    if not api_key or api_key == "YOUR_HEYREACH_API_KEY_HERE":
+    if not api_key or api_key in _PLACEHOLDERS:
         print("❌ HeyReach API key not configured")
         return False
     
+    from src import HeyReachClient
+    
     client = HeyReachClient(
         api_key=api_key,
-        base_url=heyreach_config.get('base_url', 'https://api.heyreach.io/v1')
+        base_url=heyreach_config.get('base_url', 'https://api.heyreach.io/v1'),
+        timeout=HTTP_PROBE_TIMEOUT
     )
     
     return client.test_connection()
@@ -53,19 +87,39 @@ def test_smartlead(config):
     smartlead_config = config.get('smartlead', {})
     api_key = smartlead_config.get('api_key')
     
-    if not api_key or api_key == "YOUR_SMARTLEAD_API_KEY_HERE":
+    if not api_key or api_key in _PLACEHOLDERS:
         print("❌ Smartlead API key not configured")
         return False
     
+    from src import SmartleadClient
+    
     client = SmartleadClient(
         api_key=api_key,
-        base_url=smartlead_config.get('base_url', 'https://server.smartlead.ai/api/v1')
+        base_url=smartlead_config.get('base_url', 'https://server.smartlead.ai/api/v1'),
+        timeout=HTTP_PROBE_TIMEOUT
     )
     
     return client.test_connection()
 
-def test_google_sheets(config):
-    """Test Google Sheets connection"""
+def _credentials_stat(sheets_config):
+    """stat() of the configured Google credentials file, or None if unset or missing"""
+    credentials_file = sheets_config.get('credentials_file')
+    if not credentials_file:
+        return None
+    try:
+        return os.stat(credentials_file)
+    except OSError:
+        return None
+
+
+def test_google_sheets(config, credentials_stat=_UNSET):
+    """
+    Test Google Sheets connection
+    
+    Args:
+        config: Parsed configuration
+        credentials_stat: Precomputed _credentials_stat() result; the file is stat'ed if omitted
+    """
     print("\n🔍 Testing Google Sheets connection...")
     
     sheets_config = config.get('google_sheets', {})
@@ -77,17 +131,23 @@ def test_google_sheets(config):
     credentials_file = sheets_config.get('credentials_file')
     spreadsheet_id = sheets_config.get('spreadsheet_id')
     
-    if not credentials_file or not os.path.exists(credentials_file):
+    if credentials_stat is _UNSET:
+        credentials_stat = _credentials_stat(sheets_config)
+    if credentials_stat is None:
         print(f"❌ Google credentials file not found: {credentials_file}")
         return False
     
-    if not spreadsheet_id or spreadsheet_id == "YOUR_GOOGLE_SHEET_ID_HERE":
+    if not spreadsheet_id or spreadsheet_id in _PLACEHOLDERS:
         print("❌ Google Sheets spreadsheet ID not configured")
         return False
     
+    # Imported only when Sheets is enabled so gspread/oauth2client aren't loaded otherwise
+    from src import GoogleSheetsHandler
+    
     handler = GoogleSheetsHandler(
         credentials_file=credentials_file,
-        spreadsheet_id=spreadsheet_id
+        spreadsheet_id=spreadsheet_id,
+        timeout=HTTP_PROBE_TIMEOUT
     )
     
     if handler.test_connection():
@@ -116,28 +176,177 @@ def test_email(config):
         print("❌ Email configuration incomplete")
         return False
     
-    if sender_password == "YOUR_APP_PASSWORD_HERE":
+    if sender_password in _PLACEHOLDERS:
         print("❌ Email password not configured")
         return False
     
+    from src import EmailSender
+    
     sender = EmailSender(
         smtp_server=smtp_server,
         smtp_port=smtp_port,
         sender_email=sender_email,
-        sender_password=sender_password
+        sender_password=sender_password,
+        timeout=SMTP_PROBE_TIMEOUT
     )
     
     return sender.test_connection()
 
+_probe_output = threading.local()
+
+
+class _ProbeStdout:
+    """sys.stdout proxy that routes writes from probe threads into per-thread buffers"""
+    
+    def __init__(self, stream):
+        self.stream = stream
+    
+    def write(self, text):
+        buffer = getattr(_probe_output, 'buffer', None)
+        return (buffer or self.stream).write(text)
+    
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+def _run_probe(probe, config):
+    """Run a connection probe on the current thread, capturing what it prints"""
+    _probe_output.buffer = io.StringIO()
+    try:
+        return probe(config), _probe_output.buffer.getvalue()
+    finally:
+        _probe_output.buffer = None
+
+
+def _probe_is_local(config, key: str) -> bool:
+    """True if the service's probe only reports it as disabled (no network calls)"""
+    return key in ('google_sheets', 'email_reports') and not config.get(key, {}).get('enabled', False)
+
+
+def _config_hash(sub_config) -> str:
+    """Stable hash of a service's config subtree"""
+    return hashlib.blake2b(json.dumps(sub_config, sort_keys=True, default=str).encode(), digest_size=16).hexdigest()
+
+
+def _service_fingerprint(config, key: str, credentials_stat=None) -> str:
+    """Hash of a service's config, plus the credentials file's mtime/size for Google Sheets"""
+    sub_config = config.get(key, {})
+    if key == 'google_sheets' and credentials_stat is not None:
+        sub_config = dict(sub_config, _credentials_stat=(credentials_stat.st_mtime_ns, credentials_stat.st_size))
+    return _config_hash(sub_config)
+
+
+def _load_setup_cache() -> dict:
+    """Load cached probe results ({service: {'hash': ..., 'timestamp': ...}})"""
+    try:
+        with open(SETUP_CACHE_FILE, 'rb') as f:
+            data = f.read()
+        return orjson.loads(data) if orjson else json.loads(data)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_setup_cache(cache: dict):
+    """Atomically write cached probe results (skipped if ./reports doesn't exist)"""
+    cache_dir = os.path.dirname(SETUP_CACHE_FILE)
+    if not os.path.isdir(cache_dir):
+        return
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(orjson.dumps(cache) if orjson else json.dumps(cache).encode())
+        os.replace(tmp_path, SETUP_CACHE_FILE)
+    except OSError:
+        pass
+
+
+def run_connection_tests(config, force: bool = False):
+    """
+    Run all connection probes concurrently
+    
+    Each probe is a network round-trip, so they overlap instead of running back to back.
+    Output is buffered per probe and printed in a fixed order once all have finished.
+    Services that passed within SETUP_CACHE_TTL with an unchanged config are not re-probed
+    unless force is set.
+    """
+    # The credentials file is stat'ed once, for both the cache fingerprint and the probe
+    credentials_stat = _credentials_stat(config.get('google_sheets', {}))
+    probes = {
+        'HeyReach': (test_heyreach, 'heyreach'),
+        'Smartlead': (test_smartlead, 'smartlead'),
+        'Google Sheets': (partial(test_google_sheets, credentials_stat=credentials_stat), 'google_sheets'),
+        'Email': (test_email, 'email_reports')
+    }
+    
+    cache = _load_setup_cache()
+    now = time.time()
+    config_hashes = {name: _service_fingerprint(config, key, credentials_stat) for name, (_, key) in probes.items()}
+    
+    outcomes = {}
+    pending = {}
+    for name, (probe, _) in probes.items():
+        entry = cache.get(name)
+        if (not force and entry and entry.get('hash') == config_hashes[name]
+                and now - entry.get('timestamp', 0) < SETUP_CACHE_TTL):
+            outcomes[name] = (True, f"\n✅ {name}: passed within the last {SETUP_CACHE_TTL // 3600}h "
+                                    f"(cached, run with --force to re-check)\n")
+        else:
+            pending[name] = probe
+    
+    # Disabled services just print a notice; only probes that hit the network go to the pool,
+    # and the pool is skipped entirely when there's at most one of them
+    remote = [name for name in pending if not _probe_is_local(config, probes[name][1])]
+    inline = [name for name in pending if name not in remote] if len(remote) > 1 else list(pending)
+    
+    if pending:
+        stdout = sys.stdout
+        sys.stdout = _ProbeStdout(stdout)
+        try:
+            for name in inline:
+                outcomes[name] = _run_probe(pending[name], config)
+            if len(remote) > 1:
+                with ThreadPoolExecutor(max_workers=len(remote)) as executor:
+                    futures = {name: executor.submit(_run_probe, pending[name], config) for name in remote}
+                    for name, future in futures.items():
+                        outcomes[name] = future.result()
+        finally:
+            sys.stdout = stdout
+    
+    results = {}
+    for name in probes:
+        passed, output = outcomes[name]
+        sys.stdout.write(output)
+        results[name] = passed
+        if name in pending:
+            if passed:
+                cache[name] = {'hash': config_hashes[name], 'timestamp': now}
+            else:
+                cache.pop(name, None)
+    
+    if pending:
+        _save_setup_cache(cache)
+    return results
+
+
 def create_reports_directory():
     """Create reports directory if it doesn't exist"""
     reports_dir = './reports'
-    if not os.path.exists(reports_dir):
+    try:
         os.makedirs(reports_dir)
-        print(f"✅ Created reports directory: {reports_dir}")
+    except FileExistsError:
+        return
+    print(f"✅ Created reports directory: {reports_dir}")
 
 def main():
     """Main setup function"""
+    parser = argparse.ArgumentParser(description='Verify API connections and configuration')
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Re-check every service even if it passed recently'
+    )
+    args = parser.parse_args()
+    
     print("=" * 60)
     print("🚀 Outreach Reporting Automation - Setup")
     print("=" * 60)
@@ -151,34 +360,33 @@ def main():
     create_reports_directory()
     
     # Test all connections
-    results = {
-        'HeyReach': test_heyreach(config),
-        'Smartlead': test_smartlead(config),
-        'Google Sheets': test_google_sheets(config),
-        'Email': test_email(config)
-    }
+    results = run_connection_tests(config, force=args.force)
     
-    # Summary
-    print("\n" + "=" * 60)
-    print("📊 Setup Summary")
-    print("=" * 60)
+    # Summary (built up and written once rather than a print per line)
+    lines = ["", "=" * 60, "📊 Setup Summary", "=" * 60]
     
     all_passed = True
     for service, passed in results.items():
         status = "✅ PASS" if passed else "❌ FAIL"
-        print(f"{service}: {status}")
+        lines.append(f"{service}: {status}")
         if not passed and service in ['HeyReach', 'Smartlead']:
             all_passed = False
     
-    print("\n" + "=" * 60)
+    lines += ["", "=" * 60]
     
     if all_passed:
-        print("✅ Setup completed successfully!")
-        print("\nNext steps:")
-        print("1. Run: python generate_report.py (to generate a one-time report)")
-        print("2. Run: python scheduler.py (to schedule automated reports)")
+        lines += [
+            "✅ Setup completed successfully!",
+            "",
+            "Next steps:",
+            "1. Run: python generate_report.py (to generate a one-time report)",
+            "2. Run: python scheduler.py (to schedule automated reports)"
+        ]
     else:
-        print("❌ Setup failed. Please fix the errors above and run setup again.")
+        lines.append("❌ Setup failed. Please fix the errors above and run setup again.")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+    if not all_passed:
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -4,17 +4,216 @@ Handles reading from and writing to Google Sheets
 """
 
 import re
+import copy
+import hashlib
+import time
 import logging
+import threading
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import gspread
+from gspread.utils import absolute_range_name, fill_gaps
 from google.oauth2.service_account import Credentials as ServiceAccountCredentials
 from google.oauth2.credentials import Credentials as OAuthCredentials
 from google.auth.exceptions import GoogleAuthError
 from google.auth.transport.requests import Request
 
+from google_oauth import TOKEN_REFRESH_MARGIN
+from retry_policy import RETRY_ATTEMPTS, RETRY_STATUS_CODES, backoff_delay
+
 logger = logging.getLogger(__name__)
 
+# How long a worksheet's values snapshot is reused before it is read again (seconds)
+_VALUES_CACHE_TTL = 30
+
+# Parsed worksheet structures keyed by (spreadsheet ID, worksheet name), stored as
+# (read_rows, signature, structure); see _structure_signature. A sheet whose signature is
+# unchanged reuses its structure across clients and requests.
+_STRUCTURE_CACHE: Dict[Tuple[str, str], Tuple[Tuple[int, ...], bytes, Dict]] = {}
+_STRUCTURE_CACHE_LOCK = threading.Lock()
+_STRUCTURE_CACHE_MAX = 32
+
+# Authorized OAuth clients and opened spreadsheets, keyed by (client_id, refresh_token), so a
+# SheetsClient built per web request skips the token refresh and open_by_key while the token is valid
+_OAUTH_CLIENT_CACHE: Dict[Tuple[str, str], Tuple[OAuthCredentials, gspread.Client, Dict[str, gspread.Spreadsheet]]] = {}
+_OAUTH_CLIENT_CACHE_LOCK = threading.Lock()
+# Per-token locks, so concurrent clients for one user refresh the token once and share the result.
+# A lock is kept only while its key is in _OAUTH_CLIENT_CACHE or an initialization is in progress.
+_OAUTH_INIT_LOCKS: Dict[Tuple[str, str], threading.Lock] = {}
+
+# Month/day without a year, e.g. "1/11"
+_MMDD_RE = re.compile(r'^\d{1,2}/\d{1,2}$')
+# All date header shapes _parse_date_header accepts, in one pattern: YYYY-MM-DD or YYYY/MM/DD,
+# MM/DD/YYYY, MM/DD/YY, and MM/DD. Month/day alternatives mirror strptime's %m and %d.
+_DATE_RE = re.compile(
+    r'(?P<ymd_y>\d\d\d\d)(?P<sep>[-/])(?P<ymd_m>1[0-2]|0[1-9]|[1-9])(?P=sep)(?P<ymd_d>3[01]|[12]\d|0[1-9]|[1-9]| [1-9])'
+    r'|(?P<mdy_m>1[0-2]|0[1-9]|[1-9])/(?P<mdy_d>3[01]|[12]\d|0[1-9]|[1-9]| [1-9])/(?P<mdy_y>\d\d\d\d|\d\d)'
+    r'|(?P<md_m>\d{1,2})/(?P<md_d>\d{1,2})'
+)
+# Common metric names parse_sheet_structure looks for (ordered), and as a set for row-label checks
+_METRIC_NAMES = (
+    'connections sent', 'connections accepted', 'acceptance rate',
+    'messages sent', 'message replies', 'reply rate',
+    'open conversations', 'interested', 'leads not yet enrolled',
+    'leads not enrolled'
+)
+_METRIC_NAME_SET = frozenset(_METRIC_NAMES)
+# Matches a cell containing any metric name, so most cells are rejected by one C-level scan
+_METRIC_NAME_RE = re.compile('|'.join(re.escape(name) for name in _METRIC_NAMES))
+# HeyReach metric key -> row labels that identify it in a sender block
+_METRIC_ROW_LABELS = {
+    'connections_sent': ['connections sent'],
+    'connections_accepted': ['connections accepted'],
+    'acceptance_rate': ['acceptance rate'],
+    'messages_sent': ['messages sent'],
+    'message_replies': ['message replies'],
+    'reply_rate': ['reply rate'],
+    'open_conversations': ['open conversations'],
+    'interested': ['interested'],
+    'leads_not_enrolled': ['leads not yet enrolled', 'leads not enrolled']
+}
+# Metric names grouped by the metric they identify (a sheet uses one alias per metric), in
+# _METRIC_NAMES order; parse_sheet_structure's column scan is done once every group has a match
+_METRIC_NAME_GROUPS = tuple(tuple(labels) for labels in _METRIC_ROW_LABELS.values())
+# Reverse index: row label -> metric key (no label contains another, so an exact hit is unambiguous)
+_METRIC_LABEL_INDEX = {
+    label: metric_key for metric_key, labels in _METRIC_ROW_LABELS.items() for label in labels
+}
+# Spreadsheet ID in a full sheet URL, else in an "id=" query parameter (the URL form wins wherever it appears)
+_SPREADSHEET_ID_RE = re.compile(
+    r'(?:.*?/spreadsheets/d/([a-zA-Z0-9-_]+)|.*?id=([a-zA-Z0-9-_]+))', re.DOTALL
+)
+
+
+def _structure_signature(all_values: List[List[str]], read_rows: Tuple[int, ...]) -> bytes:
+    """
+    Checksum of the cells a parsed structure depends on: the first cell of every row, and every
+    cell of the rows the scan read cell by cell (read_rows, from _build_sheet_structure).
+    
+    Which rows are read depends only on those same cells, so an equal checksum means a re-parse
+    would read the same rows and build the same structure. Values written into metric rows
+    (the weekly numbers) don't change it.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr([row[0] if row else '' for row in all_values]).encode())
+    digest.update(repr([all_values[row_idx] for row_idx in read_rows if row_idx < len(all_values)]).encode())
+    return digest.digest()
+
+
+def _copy_structure(structure: Dict) -> Dict:
+    """Copy a cached structure, deep enough that populate_heyreach_data's new date columns stay local"""
+    return dict(structure, date_columns=dict(structure['date_columns']))
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_header(value_str: str, current_year: int) -> Optional[str]:
+    """
+    Parse a stripped, non-empty date header into ISO format (YYYY-MM-DD).
+    current_year is used for MM/DD headers and is part of the cache key.
+    """
+    # One regex match decides the format; non-dates fall out here without any exceptions
+    match = _DATE_RE.fullmatch(value_str)
+    if not match:
+        return None
+    
+    groups = match.groupdict()
+    if groups['ymd_y']:
+        year, month, day = groups['ymd_y'], groups['ymd_m'], groups['ymd_d']
+    elif groups['mdy_y']:
+        year, month, day = groups['mdy_y'], groups['mdy_m'], groups['mdy_d']
+        if len(year) == 2:
+            # Same pivot as strptime's %y: 00-68 -> 2000s, 69-99 -> 1900s
+            year = int(year) + (2000 if int(year) <= 68 else 1900)
+    else:
+        # MM/DD without a year: assume the current year
+        year, month, day = current_year, groups['md_m'], groups['md_d']
+    
+    try:
+        parsed = datetime(int(year), int(month), int(day))
+    except ValueError:
+        return None
+    return f"{parsed.year:04d}-{parsed.month:02d}-{parsed.day:02d}"
+
+
+def _prepare_sender_weeks(sender_data_map: Dict) -> Dict[str, List[Tuple[str, Dict]]]:
+    """
+    Lowercased sender name -> [(week_end, metric values to write)] for one sender map
+    
+    The first name wins when two differ only by case. Weeks without an end date are dropped.
+    """
+    prepared = {}
+    for sender_name, weeks_data in sender_data_map.items():
+        sender_lower = sender_name.lower()
+        if sender_lower in prepared:
+            continue
+        weeks = []
+        for week_data in weeks_data or ():
+            week_end = week_data.get('week_end') or week_data.get('week_end_date') or week_data.get('weekStart')
+            if not week_end:
+                continue
+            
+            # Calculate rates for this week
+            connections_sent = week_data.get('connections_sent', 0) or 0
+            connections_accepted = week_data.get('connections_accepted', 0) or 0
+            messages_sent = week_data.get('messages_sent', 0) or 0
+            message_replies = week_data.get('message_replies', 0) or 0
+            
+            acceptance_rate = (connections_accepted / connections_sent * 100) if connections_sent > 0 else 0
+            reply_rate = (message_replies / messages_sent * 100) if messages_sent > 0 else 0
+            
+            weeks.append((week_end, {
+                'connections_sent': int(connections_sent),
+                'connections_accepted': int(connections_accepted),
+                'acceptance_rate': f"{acceptance_rate:.2f}%",
+                'messages_sent': int(messages_sent),
+                'message_replies': int(message_replies),
+                'reply_rate': f"{reply_rate:.2f}%",
+                'open_conversations': int(week_data.get('open_conversations', 0) or 0),
+                'interested': int(week_data.get('interested', 0) or 0),
+                'leads_not_enrolled': int(week_data.get('leads_not_enrolled', 0) or 0)
+            }))
+        prepared[sender_lower] = weeks
+    return prepared
+
+
+def prepare_heyreach_data(heyreach_data: Dict) -> Dict:
+    """
+    Normalize a HeyReach payload once, so every worksheet populated from it reuses the work
+    
+    Args:
+        heyreach_data: Data from HeyReach API (from get_sender_weekly_performance)
+    
+    Returns:
+        Dictionary with 'senders' (see _prepare_sender_weeks) and 'clients', a list of
+        (lowercased client name, prepared senders) in payload order
+    """
+    return {
+        'senders': _prepare_sender_weeks(heyreach_data.get('senders', {}) or {}),
+        'clients': [
+            (str(client_name).lower().strip(), _prepare_sender_weeks(client_senders or {}))
+            for client_name, client_senders in (heyreach_data.get('clients', {}) or {}).items()
+        ]
+    }
+
+
+class _RetryingClient(gspread.Client):
+    """gspread client that retries rate-limited (429) and transient (5xx) Sheets API errors"""
+    
+    def request(self, *args, **kwargs):
+        for attempt in range(RETRY_ATTEMPTS):
+            try:
+                return super().request(*args, **kwargs)
+            except gspread.exceptions.APIError as e:
+                status = e.response.status_code
+                if status not in RETRY_STATUS_CODES or attempt == RETRY_ATTEMPTS - 1:
+                    raise
+                delay = backoff_delay(attempt, e.response.headers.get('Retry-After'))
+                logger.warning(f"Sheets API returned {status}, retrying in {delay:.1f}s "
+                               f"(attempt {attempt + 1}/{RETRY_ATTEMPTS})")
+                time.sleep(delay)
+
 
 class SheetsClient:
     """Client for interacting with Google Sheets"""
@@ -35,6 +234,11 @@ class SheetsClient:
         self.client = None
         self.spreadsheet = None
         
+        # Worksheet handles and get_all_values() snapshots, so each sheet is looked up and read once.
+        # A sheet's snapshot is dropped whenever this client writes to it, or after _VALUES_CACHE_TTL.
+        self._worksheets: Dict[str, gspread.Worksheet] = {}
+        self._values_cache: Dict[str, Tuple[float, List[List[str]]]] = {}
+        
         # Extract spreadsheet ID from URL
         self.spreadsheet_id = self._extract_spreadsheet_id(sheet_url)
         if not self.spreadsheet_id:
@@ -46,52 +250,29 @@ class SheetsClient:
     def _extract_spreadsheet_id(self, url: str) -> Optional[str]:
         """Extract spreadsheet ID from Google Sheets URL"""
         # Pattern: https://docs.google.com/spreadsheets/d/{SPREADSHEET_ID}/edit...
-        patterns = [
-            r'/spreadsheets/d/([a-zA-Z0-9-_]+)',
-            r'id=([a-zA-Z0-9-_]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        
-        return None
+        match = _SPREADSHEET_ID_RE.match(url)
+        return (match.group(1) or match.group(2)) if match else None
     
     def _initialize_client(self):
         """Initialize gspread client"""
         try:
             if self.oauth_token:
                 # Use OAuth 2.0 credentials (for SaaS - user authorized access)
-                creds = OAuthCredentials(
-                    token=self.oauth_token.get('token'),
-                    refresh_token=self.oauth_token.get('refresh_token'),
-                    token_uri=self.oauth_token.get('token_uri', 'https://oauth2.googleapis.com/token'),
-                    client_id=self.oauth_token.get('client_id'),
-                    client_secret=self.oauth_token.get('client_secret'),
-                    scopes=self.oauth_token.get('scopes', ['https://www.googleapis.com/auth/spreadsheets'])
-                )
-                
-                # Refresh token if expired
-                if creds.expired and creds.refresh_token:
-                    creds.refresh(Request())
-                    # Update token in oauth_token dict
-                    self.oauth_token['token'] = creds.token
-                
-                self.client = gspread.authorize(creds)
-                logger.info("Initialized Google Sheets client with OAuth 2.0 credentials")
-            elif self.credentials_json:
+                self._initialize_oauth_client()
+                return
+            
+            if self.credentials_json:
                 # Use service account credentials
                 creds = ServiceAccountCredentials.from_service_account_info(
                     self.credentials_json,
                     scopes=['https://www.googleapis.com/auth/spreadsheets']
                 )
-                self.client = gspread.authorize(creds)
+                self.client = gspread.authorize(creds, client_factory=_RetryingClient)
                 logger.info("Initialized Google Sheets client with service account credentials")
             else:
                 # Try to use default service account (from environment or default location)
                 try:
-                    self.client = gspread.service_account()
+                    self.client = gspread.service_account(client_factory=_RetryingClient)
                     logger.info("Initialized Google Sheets client with default service account")
                 except Exception as e:
                     logger.warning(f"No default service account found: {e}")
@@ -110,6 +291,102 @@ class SheetsClient:
             logger.error(f"Error initializing Google Sheets client: {e}")
             raise
     
+    def _initialize_oauth_client(self):
+        """Authorize with the caller's OAuth token, reusing a cached client while its token is valid"""
+        key = self._oauth_cache_key()
+        with _OAUTH_CLIENT_CACHE_LOCK:
+            init_lock = _OAUTH_INIT_LOCKS.setdefault(key, threading.Lock())
+        
+        try:
+            # Threads that waited here find the client the first one cached instead of refreshing again
+            with init_lock:
+                if self._use_cached_oauth_client():
+                    return
+                
+                creds = OAuthCredentials(
+                    token=self.oauth_token.get('token'),
+                    refresh_token=self.oauth_token.get('refresh_token'),
+                    token_uri=self.oauth_token.get('token_uri', 'https://oauth2.googleapis.com/token'),
+                    client_id=self.oauth_token.get('client_id'),
+                    client_secret=self.oauth_token.get('client_secret'),
+                    scopes=self.oauth_token.get('scopes', ['https://www.googleapis.com/auth/spreadsheets']),
+                    expiry=datetime.fromisoformat(self.oauth_token['expiry']) if self.oauth_token.get('expiry') else None
+                )
+                
+                # Refresh token if expired or about to expire. Without an expiry this never fired and
+                # the first Sheets call after expiry paid for a 401 plus refresh-and-retry instead.
+                # google-auth stores expiry as naive UTC.
+                expiring = creds.expiry is not None and creds.expiry - datetime.utcnow() < TOKEN_REFRESH_MARGIN
+                if (creds.expired or expiring) and creds.refresh_token:
+                    creds.refresh(Request())
+                    # Update token in oauth_token dict
+                    self.oauth_token['token'] = creds.token
+                    self.oauth_token['expiry'] = creds.expiry.isoformat() if creds.expiry else None
+                
+                self.client = gspread.authorize(creds, client_factory=_RetryingClient)
+                logger.info("Initialized Google Sheets client with OAuth 2.0 credentials")
+                
+                self.spreadsheet = self.client.open_by_key(self.spreadsheet_id)
+                logger.info(f"Opened spreadsheet: {self.spreadsheet.title}")
+                if creds.refresh_token:
+                    self._cache_oauth_client(creds)
+        finally:
+            # Keep the lock only while its client is cached; tokens that are never cached (no refresh
+            # token, or a failed init) would otherwise leave one lock per token behind
+            with _OAUTH_CLIENT_CACHE_LOCK:
+                if key not in _OAUTH_CLIENT_CACHE and _OAUTH_INIT_LOCKS.get(key) is init_lock:
+                    del _OAUTH_INIT_LOCKS[key]
+    
+    def _oauth_cache_key(self) -> Tuple[str, str]:
+        """Key for _OAUTH_CLIENT_CACHE: the OAuth client ID and refresh token"""
+        return (self.oauth_token.get('client_id') or '', self.oauth_token.get('refresh_token') or '')
+    
+    def _cache_oauth_client(self, creds: OAuthCredentials):
+        """Cache this client's OAuth credentials, gspread client and spreadsheet for reuse"""
+        now = datetime.utcnow()
+        own_key = self._oauth_cache_key()
+        with _OAUTH_CLIENT_CACHE_LOCK:
+            # Drop entries whose tokens have expired so the cache stays bounded by active users
+            for key in [key for key, (cached, _, _) in _OAUTH_CLIENT_CACHE.items()
+                        if cached.expiry is None or cached.expiry < now]:
+                del _OAUTH_CLIENT_CACHE[key]
+                if key != own_key:
+                    _OAUTH_INIT_LOCKS.pop(key, None)
+            _OAUTH_CLIENT_CACHE[own_key] = (
+                creds, self.client, {self.spreadsheet_id: self.spreadsheet}
+            )
+    
+    def _use_cached_oauth_client(self) -> bool:
+        """
+        Reuse a cached OAuth client whose access token is still valid
+        
+        Returns:
+            True if self.client and self.spreadsheet were set from the cache
+        """
+        with _OAUTH_CLIENT_CACHE_LOCK:
+            cached = _OAUTH_CLIENT_CACHE.get(self._oauth_cache_key())
+            if cached is None:
+                return False
+            creds, client, spreadsheets = cached
+            # google-auth stores expiry as naive UTC
+            if creds.expiry is None or creds.expiry - datetime.utcnow() < TOKEN_REFRESH_MARGIN:
+                del _OAUTH_CLIENT_CACHE[self._oauth_cache_key()]
+                return False
+            spreadsheet = spreadsheets.get(self.spreadsheet_id)
+        
+        if spreadsheet is None:
+            spreadsheet = client.open_by_key(self.spreadsheet_id)
+            with _OAUTH_CLIENT_CACHE_LOCK:
+                spreadsheets[self.spreadsheet_id] = spreadsheet
+        
+        self.client = client
+        self.spreadsheet = spreadsheet
+        # Hand the caller the current token, in case another request refreshed it
+        self.oauth_token['token'] = creds.token
+        self.oauth_token['expiry'] = creds.expiry.isoformat()
+        logger.info(f"Reusing Google Sheets OAuth client for spreadsheet: {spreadsheet.title}")
+        return True
+    
     def _normalize_date_string(self, value: str) -> Optional[str]:
         """
         Normalize a sheet date header into ISO format (YYYY-MM-DD).
@@ -122,92 +399,176 @@ class SheetsClient:
         if not value_str:
             return None
         
-        # Try several known formats
-        date_formats = ['%Y-%m-%d', '%m/%d/%Y', '%m/%d/%y', '%Y/%m/%d']
-        for fmt in date_formats:
-            try:
-                return datetime.strptime(value_str, fmt).strftime('%Y-%m-%d')
-            except ValueError:
-                continue
-        
-        # Handle MM/DD without a year by assuming current year
-        if re.match(r'^\d{1,2}/\d{1,2}$', value_str):
-            try:
-                month, day = value_str.split('/')
-                today_year = datetime.now().year
-                parsed = datetime(today_year, int(month), int(day))
-                return parsed.strftime('%Y-%m-%d')
-            except Exception:
-                return None
-        
-        return None
+        # Header strings repeat across rows and sheets, so parsing is memoized per (string, year)
+        return _parse_date_header(value_str, datetime.now().year)
     
-    def _find_or_create_date_column(self, worksheet, structure: Dict, target_date: str) -> Optional[int]:
+    def _find_or_create_date_column(self, worksheet, structure: Dict, target_date: str,
+                                    pending_cells: List[gspread.Cell]) -> Optional[int]:
         """
-        Find the column for the target date; if missing, append a new column with that date header.
+        Find the column for the target date; if missing, reserve a new column at the end of the sheet.
+        The new column's header cell is queued in pending_cells and the column itself is counted in
+        structure['new_date_columns']; both are written by _flush_pending_writes.
         """
+        date_columns = structure.get('date_columns', {})
+        
+        # Keys are normalized ISO dates, and HeyReach week_end values already are, so a hit
+        # here skips normalization entirely (the usual case after the first sender)
+        if target_date in date_columns:
+            return date_columns[target_date]
+        
         norm = self._normalize_date_string(target_date)
         if not norm:
             return None
         
-        date_columns = structure.get('date_columns', {})
         date_row = structure.get('date_row') or 1
         
         # Return existing column if found
         if norm in date_columns:
             return date_columns[norm]
         
-        try:
-            # Append a new column at the end
-            new_col_index = worksheet.col_count + 1
-            worksheet.add_cols(1)
-            worksheet.update_cell(date_row, new_col_index, norm)
-            
-            # Track the new column in the local structure for downstream writes
-            date_columns[norm] = new_col_index
-            structure['date_columns'] = date_columns
-            
-            logger.info(f"Added new date column {norm} at index {new_col_index}")
-            return new_col_index
-        except Exception as e:
-            logger.error(f"Error creating date column for {norm}: {e}")
-            return None
+        # Reserve the next column past the sheet's current width and any already reserved
+        new_col_index = worksheet.col_count + structure.get('new_date_columns', 0) + 1
+        structure['new_date_columns'] = structure.get('new_date_columns', 0) + 1
+        pending_cells.append(gspread.Cell(date_row, new_col_index, norm))
+        
+        # Track the new column in the local structure for downstream writes
+        date_columns[norm] = new_col_index
+        structure['date_columns'] = date_columns
+        
+        logger.info(f"Adding new date column {norm} at index {new_col_index}")
+        return new_col_index
+    
+    def _flush_pending_writes(self, worksheet, structure: Dict, pending_cells: List[gspread.Cell]):
+        """
+        Append any reserved date columns and write all queued cells in two API calls
+        (instead of one add_cols/update_cell round-trip per column and cell).
+        """
+        new_columns = structure.get('new_date_columns', 0)
+        if new_columns or pending_cells:
+            self._values_cache.pop(worksheet.title, None)
+        
+        if new_columns:
+            # One resize for all new columns; also keeps the handle's col_count current
+            worksheet.add_cols(new_columns)
+            structure['new_date_columns'] = 0
+        if pending_cells:
+            # USER_ENTERED matches update_cell, so "12.50%" and dates are parsed as before
+            worksheet.update_cells(pending_cells, value_input_option='USER_ENTERED')
     
-    def _get_metric_rows_for_sender(self, all_values: List[List[str]], start_row_idx: int, end_row_idx: int,
-                                    metric_mapping: Dict[str, List[str]]) -> Dict[str, int]:
+    def _get_metric_rows_for_sender(self, first_column_lower: List[str], start_row_idx: int,
+                                    end_row_idx: int) -> Dict[str, int]:
         """
-        Given the full sheet values and the row range for a sender block, find the row index for each metric.
-        Returns 1-indexed row numbers for each metric.
+        Given the sheet's lowercased first column and the row range for a sender block, find the row index
+        for each metric. Returns 1-indexed row numbers for each metric.
         """
         metric_rows = {}
-        for row_idx in range(start_row_idx + 1, end_row_idx):
-            if row_idx >= len(all_values):
-                break
-            row = all_values[row_idx] if row_idx < len(all_values) else []
-            first_cell = row[0].strip().lower() if row and row[0] else ""
+        for row_idx in range(start_row_idx + 1, min(end_row_idx, len(first_column_lower))):
+            first_cell = first_column_lower[row_idx]
+            if not first_cell:
+                continue
             
-            for metric_key, metric_names in metric_mapping.items():
-                if metric_key in metric_rows:
-                    continue
-                for name in metric_names:
-                    if name in first_cell:
-                        metric_rows[metric_key] = row_idx + 1  # 1-indexed
-                        break
+            # Usual case: the cell is exactly a metric label
+            metric_key = _METRIC_LABEL_INDEX.get(first_cell)
+            if metric_key:
+                metric_rows.setdefault(metric_key, row_idx + 1)  # 1-indexed
+                continue
+            
+            # Otherwise look for labels contained in the cell, e.g. "total reply rate"
+            for label, metric_key in _METRIC_LABEL_INDEX.items():
+                if metric_key not in metric_rows and label in first_cell:
+                    metric_rows[metric_key] = row_idx + 1  # 1-indexed
+            
+            if len(metric_rows) == len(_METRIC_ROW_LABELS):
+                break
         return metric_rows
     
+    def _get_worksheet(self, worksheet_name: str) -> gspread.Worksheet:
+        """Get a worksheet handle, reusing one already fetched"""
+        worksheet = self._worksheets.get(worksheet_name)
+        if worksheet is None:
+            # One metadata fetch loads handles for every sheet, same cost as spreadsheet.worksheet(name)
+            self._worksheets.update((ws.title, ws) for ws in self.spreadsheet.worksheets())
+            worksheet = self._worksheets.get(worksheet_name)
+            if worksheet is None:
+                raise gspread.exceptions.WorksheetNotFound(worksheet_name)
+        return worksheet
+    
+    def invalidate_worksheet_cache(self, worksheet_name: Optional[str] = None):
+        """
+        Drop cached worksheet handles and values, e.g. after the sheet was changed outside this client
+        
+        Args:
+            worksheet_name: Only drop this worksheet's entries (default: all worksheets)
+        """
+        if worksheet_name is None:
+            self._worksheets.clear()
+            self._values_cache.clear()
+        else:
+            self._worksheets.pop(worksheet_name, None)
+            self._values_cache.pop(worksheet_name, None)
+    
+    def _cached_values(self, worksheet_name: str) -> Optional[List[List[str]]]:
+        """Cached values for a worksheet, or None if not cached or older than _VALUES_CACHE_TTL"""
+        entry = self._values_cache.get(worksheet_name)
+        if entry is None or time.monotonic() - entry[0] > _VALUES_CACHE_TTL:
+            return None
+        return entry[1]
+    
+    def _cache_values(self, worksheet_name: str, all_values: List[List[str]]):
+        """Store a worksheet's values snapshot"""
+        self._values_cache[worksheet_name] = (time.monotonic(), all_values)
+    
+    def _get_ws(self, worksheet_name: str) -> Tuple[gspread.Worksheet, List[List[str]]]:
+        """Get a worksheet handle and its values, reading the sheet only if not already cached"""
+        worksheet = self._get_worksheet(worksheet_name)
+        all_values = self._cached_values(worksheet_name)
+        if all_values is None:
+            all_values = worksheet.get_all_values()
+            self._cache_values(worksheet_name, all_values)
+        return worksheet, all_values
+    
+    def prefetch_all_values(self, names: List[str]) -> Dict[str, List[List[str]]]:
+        """
+        Read several worksheets in a single values.batchGet call and cache the results
+        
+        Args:
+            names: Worksheet names to read
+        
+        Returns:
+            Dictionary mapping worksheet name to its values (same shape as get_all_values)
+        """
+        values = {name: self._cached_values(name) for name in names}
+        missing = [name for name, all_values in values.items() if all_values is None]
+        if missing:
+            try:
+                response = self.spreadsheet.values_batch_get([absolute_range_name(name) for name in missing])
+                for name, value_range in zip(missing, response.get('valueRanges', [])):
+                    values[name] = fill_gaps(value_range.get('values', []))
+                    self._cache_values(name, values[name])
+            except Exception as e:
+                # Sheets not cached here are read individually on first use
+                logger.error(f"Error prefetching worksheet values: {e}")
+        return {name: all_values for name, all_values in values.items() if all_values is not None}
+    
     def get_worksheet_names(self) -> List[str]:
         """Get list of all worksheet names in the spreadsheet"""
         try:
             worksheets = self.spreadsheet.worksheets()
+            # Keep the handles so later per-sheet calls skip the metadata lookup
+            self._worksheets.update((ws.title, ws) for ws in worksheets)
             return [ws.title for ws in worksheets]
         except Exception as e:
             logger.error(f"Error getting worksheet names: {e}")
             return []
     
-    def parse_sheet_structure(self, worksheet_name: str) -> Dict:
+    def parse_sheet_structure(self, worksheet_name: str, all_values: Optional[List[List[str]]] = None) -> Dict:
         """
         Parse a worksheet to understand its structure
         
+        Args:
+            worksheet_name: Name of the worksheet
+            all_values: Optional values already read from the worksheet (fetched if not given)
+        
         Returns:
             Dictionary with:
             - 'senders': List of sender info (name, row_index)
@@ -216,121 +577,154 @@ class SheetsClient:
             - 'year_cell': Cell reference for year (if found)
         """
         try:
-            worksheet = self.spreadsheet.worksheet(worksheet_name)
-            all_values = worksheet.get_all_values()
+            if all_values is None:
+                _, all_values = self._get_ws(worksheet_name)
             
             if not all_values:
                 return {'senders': [], 'metrics': {}, 'date_column': None, 'year_cell': None}
             
-            structure = {
-                'senders': [],
-                'metrics': {},
-                'date_column': None,
-                'year_cell': None,
-                'data_start_row': None,
-                'date_columns': {},
-                'date_row': None
-            }
+            # Checksumming the first column and the rows the scan reads is far cheaper than re-parsing
+            key = (self.spreadsheet_id, worksheet_name)
+            with _STRUCTURE_CACHE_LOCK:
+                cached = _STRUCTURE_CACHE.get(key)
+            if cached is not None and _structure_signature(all_values, cached[0]) == cached[1]:
+                logger.debug(f"Reusing parsed structure for unchanged worksheet '{worksheet_name}'")
+                return _copy_structure(cached[2])
             
-            # Common metric names to look for
-            metric_names = [
-                'connections sent', 'connections accepted', 'acceptance rate',
-                'messages sent', 'message replies', 'reply rate',
-                'open conversations', 'interested', 'leads not yet enrolled',
-                'leads not enrolled'
-            ]
+            structure, read_rows = self._build_sheet_structure(all_values)
+            signature = _structure_signature(all_values, read_rows)
+            with _STRUCTURE_CACHE_LOCK:
+                _STRUCTURE_CACHE.pop(key, None)
+                if len(_STRUCTURE_CACHE) >= _STRUCTURE_CACHE_MAX:
+                    # Evict the oldest entry (dicts keep insertion order)
+                    del _STRUCTURE_CACHE[next(iter(_STRUCTURE_CACHE))]
+                _STRUCTURE_CACHE[key] = (read_rows, signature, structure)
+            return _copy_structure(structure)
+            
+        except Exception as e:
+            logger.exception("Error parsing sheet structure: %s", e)
+            return {'senders': [], 'metrics': {}, 'date_column': None, 'year_cell': None}
+    
+    def _build_sheet_structure(self, all_values: List[List[str]]) -> Tuple[Dict, Tuple[int, ...]]:
+        """
+        Scan a worksheet's values into the structure returned by parse_sheet_structure
+        
+        Returns:
+            The structure, and the indices of the rows whose cells past the first were read; for
+            every other row only the first cell affects the result
+        """
+        structure = {
+            'senders': [],
+            'metrics': {},
+            'date_column': None,
+            'year_cell': None,
+            'data_start_row': None,
+            'date_columns': {},
+            'date_row': None,
+            # Stripped, lowercased first cell of every row, shared with populate_heyreach_data
+            'first_column_lower': []
+        }
+        first_column_lower = structure['first_column_lower']
+        
+        # Single pass over the rows: year cell, date header row, data start row, senders and metrics
+        current_sender = None
+        sender_row = None
+        # Metric alias groups not located yet; the per-cell scan stops once this is empty
+        pending_metrics = list(_METRIC_NAME_GROUPS)
+        # Rows read cell by cell: row 0 (year), rows up to the date row, and non-label rows while
+        # metrics are pending. Label rows past the date row hold the weekly numbers and aren't read.
+        read_rows = []
+        
+        for row_idx, row in enumerate(all_values):
+            first_cell = row[0].strip() if row else ""
+            first_cell_lower = first_cell.lower()
+            first_column_lower.append(first_cell_lower)
+            
+            if row_idx == 0 or structure['date_row'] is None:
+                read_rows.append(row_idx)
             
             # Find year in first row
-            if len(all_values) > 0:
-                first_row = [str(cell).lower().strip() for cell in all_values[0]]
-                for col_idx, cell in enumerate(first_row):
+            if row_idx == 0:
+                for col_idx, cell in enumerate(row):
+                    cell = str(cell).strip()
                     if cell.isdigit() and len(cell) == 4:  # Year
                         structure['year_cell'] = (1, col_idx + 1)  # 1-indexed
             
-            # Detect date columns (first row that has date-like values)
-            for row_idx, row in enumerate(all_values):
+            # Detect date columns (assume the first row with any date headers is the date row)
+            if structure['date_row'] is None:
                 for col_idx, cell in enumerate(row):
+                    # Every accepted date shape has a '/' or '-' separator; skip names, labels and numbers
+                    if len(cell) < 3 or ('/' not in cell and '-' not in cell):
+                        continue
                     norm = self._normalize_date_string(cell)
                     if norm:
                         if structure['date_row'] is None:
                             structure['date_row'] = row_idx + 1  # 1-indexed
                         structure['date_columns'][norm] = col_idx + 1  # 1-indexed
-                if structure['date_columns']:
-                    # Assume first row with any date headers is the date row
-                    break
-            
-            # Find senders and metrics
-            current_sender = None
-            sender_row = None
             
-            for row_idx, row in enumerate(all_values):
-                row_lower = [str(cell).lower().strip() for cell in row]
-                
-                # Check if this row contains a sender name (usually in first column)
-                first_cell = row[0].strip() if row else ""
-                first_cell_lower = first_cell.lower()
-                
-                # Skip if it's a metric name or empty
-                if not first_cell or first_cell_lower in metric_names:
-                    continue
-                
-                # Check if it looks like a sender name (not a number, not a date, has letters)
-                if first_cell and not first_cell.isdigit() and not re.match(r'^\d{1,2}/\d{1,2}$', first_cell):
-                    # This might be a sender name
-                    if current_sender and sender_row is not None:
-                        # Save previous sender
-                        structure['senders'].append({
-                            'name': current_sender,
-                            'row': sender_row + 1,  # 1-indexed
-                            'row_index': sender_row  # 0-indexed
-                        })
-                    
-                    current_sender = first_cell
-                    sender_row = row_idx
-                
-                # Look for metrics in this row
-                for col_idx, cell in enumerate(row_lower):
-                    for metric in metric_names:
-                        if metric in cell:
-                            if metric not in structure['metrics']:
-                                structure['metrics'][metric] = col_idx + 1  # 1-indexed
+            # Find data start row (first row after headers with an MM/DD date in the first column)
+            is_mmdd = bool(_MMDD_RE.match(first_cell))
+            if is_mmdd and row_idx > 0 and structure['data_start_row'] is None:
+                structure['data_start_row'] = row_idx + 1  # 1-indexed
+                structure['date_column'] = 1  # Dates in first column
             
-            # Add last sender
-            if current_sender and sender_row is not None:
-                structure['senders'].append({
-                    'name': current_sender,
-                    'row': sender_row + 1,
-                    'row_index': sender_row
-                })
-            
-            # Find data start row (first row after headers that might contain dates)
-            for row_idx, row in enumerate(all_values):
-                if row_idx == 0:
-                    continue
-                first_cell = row[0].strip() if row else ""
-                # Check if it looks like a date (MM/DD format)
-                if re.match(r'^\d{1,2}/\d{1,2}$', first_cell):
-                    structure['data_start_row'] = row_idx + 1  # 1-indexed
-                    structure['date_column'] = 1  # Dates in first column
-                    break
+            # Skip if it's a metric name or empty
+            if not first_cell or first_cell_lower in _METRIC_NAME_SET:
+                continue
             
-            logger.info(f"Parsed sheet structure: {len(structure['senders'])} senders, {len(structure['metrics'])} metrics")
-            return structure
+            # Check if it looks like a sender name (not a number, not a date, has letters)
+            if not first_cell.isdigit() and not is_mmdd:
+                # This might be a sender name
+                if current_sender and sender_row is not None:
+                    # Save previous sender
+                    structure['senders'].append({
+                        'name': current_sender,
+                        'row': sender_row + 1,  # 1-indexed
+                        'row_index': sender_row  # 0-indexed
+                    })
+                
+                current_sender = first_cell
+                sender_row = row_idx
             
-        except Exception as e:
-            logger.error(f"Error parsing sheet structure: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
-            return {'senders': [], 'metrics': {}, 'date_column': None, 'year_cell': None}
+            # Look for metrics in this row
+            if pending_metrics:
+                if not read_rows or read_rows[-1] != row_idx:
+                    read_rows.append(row_idx)
+                for col_idx, cell in enumerate(row):
+                    cell_lower = str(cell).lower().strip()
+                    if not _METRIC_NAME_RE.search(cell_lower):
+                        continue
+                    found = [group for group in pending_metrics if any(metric in cell_lower for metric in group)]
+                    for group in found:
+                        for metric in group:
+                            if metric in cell_lower:
+                                structure['metrics'][metric] = col_idx + 1  # 1-indexed
+                        pending_metrics.remove(group)
+        
+        # Add last sender
+        if current_sender and sender_row is not None:
+            structure['senders'].append({
+                'name': current_sender,
+                'row': sender_row + 1,
+                'row_index': sender_row
+            })
+        
+        logger.info(f"Parsed sheet structure: {len(structure['senders'])} senders, {len(structure['metrics'])} metrics")
+        return structure, tuple(read_rows)
     
     def find_sender_row(self, worksheet_name: str, sender_name: str) -> Optional[int]:
         """Find the row index (1-indexed) for a sender name"""
         try:
-            worksheet = self.spreadsheet.worksheet(worksheet_name)
-            all_values = worksheet.get_all_values()
+            all_values = self._cached_values(worksheet_name)
+            if all_values is not None:
+                first_column = [row[0] if row else "" for row in all_values]
+            else:
+                # Only column A is needed, so read just that instead of the whole sheet
+                first_column = self._get_worksheet(worksheet_name).col_values(1)
             
-            for row_idx, row in enumerate(all_values, start=1):
-                if row and row[0].strip().lower() == sender_name.lower():
+            sender_lower = sender_name.lower()
+            for row_idx, cell in enumerate(first_column, start=1):
+                if cell.strip().lower() == sender_lower:
                     return row_idx
             
             return None
@@ -341,8 +735,7 @@ class SheetsClient:
     def find_metric_column(self, worksheet_name: str, metric_name: str) -> Optional[int]:
         """Find the column index (1-indexed) for a metric"""
         try:
-            worksheet = self.spreadsheet.worksheet(worksheet_name)
-            all_values = worksheet.get_all_values()
+            _, all_values = self._get_ws(worksheet_name)
             
             metric_lower = metric_name.lower()
             metric_variations = [
@@ -366,7 +759,13 @@ class SheetsClient:
     def get_cell_value(self, worksheet_name: str, row: int, col: int) -> Optional[str]:
         """Get value from a specific cell (1-indexed)"""
         try:
-            worksheet = self.spreadsheet.worksheet(worksheet_name)
+            # Serve from the cached snapshot when there is one (cells past its edges are empty)
+            all_values = self._cached_values(worksheet_name)
+            if all_values is not None:
+                row_values = all_values[row - 1] if 0 < row <= len(all_values) else []
+                return row_values[col - 1] if 0 < col <= len(row_values) else ''
+            
+            worksheet = self._get_worksheet(worksheet_name)
             cell = worksheet.cell(row, col)
             return cell.value
         except Exception as e:
@@ -376,15 +775,85 @@ class SheetsClient:
     def update_cell(self, worksheet_name: str, row: int, col: int, value: str):
         """Update a cell value (1-indexed)"""
         try:
-            worksheet = self.spreadsheet.worksheet(worksheet_name)
+            worksheet = self._get_worksheet(worksheet_name)
             worksheet.update_cell(row, col, value)
+            self._values_cache.pop(worksheet_name, None)
             logger.debug(f"Updated cell ({row}, {col}) in '{worksheet_name}' with value: {value}")
         except Exception as e:
             logger.error(f"Error updating cell: {e}")
             raise
     
+    def populate_many(self, worksheet_names: List[str], heyreach_data: Dict,
+                      date_range: Tuple[str, str], max_workers: int = 4) -> Dict[str, Dict]:
+        """
+        Populate HeyReach data into several worksheets concurrently
+        
+        Each worksheet is read and written independently (one batched write per sheet), so running
+        them on a small thread pool overlaps Google's per-request latency. Every worker uses its
+        own copy of this client (see _worker_client).
+        
+        Args:
+            worksheet_names: Names of the worksheets to populate
+            heyreach_data: Data from HeyReach API (from get_sender_weekly_performance)
+            date_range: Tuple of (start_date, end_date) in YYYY-MM-DD format
+            max_workers: Maximum worksheets processed at once (kept small for Sheets write quotas)
+        
+        Returns:
+            Dictionary mapping worksheet name to its results ({'updated': int, 'errors': List[str]}),
+            in the order of worksheet_names
+        """
+        # Normalize the payload once rather than once per worksheet
+        prepared = prepare_heyreach_data(heyreach_data)
+        
+        def populate(worksheet_name, client=self):
+            try:
+                logger.info(f"Populating worksheet: {worksheet_name}")
+                return client.populate_heyreach_data(worksheet_name, heyreach_data, date_range, prepared=prepared)
+            except Exception as e:
+                error_msg = f"Error populating worksheet '{worksheet_name}': {e}"
+                logger.error(error_msg)
+                return {'updated': 0, 'errors': [error_msg]}
+        
+        if len(worksheet_names) <= 1:
+            return {name: populate(name) for name in worksheet_names}
+        
+        # Refresh once up front so workers only read the shared credentials' token
+        if not self.client.auth.valid:
+            self.client.auth.refresh(Request())
+        
+        def populate_in_worker(worksheet_name):
+            return populate(worksheet_name, self._worker_client())
+        
+        try:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(worksheet_names))) as executor:
+                return dict(zip(worksheet_names, executor.map(populate_in_worker, worksheet_names)))
+        finally:
+            # Workers wrote through their own handles, so ours may be stale (values, column counts)
+            for worksheet_name in worksheet_names:
+                self.invalidate_worksheet_cache(worksheet_name)
+    
+    def _worker_client(self) -> 'SheetsClient':
+        """
+        Copy of this client for one populate_many worker
+        
+        The copy has its own HTTP session (gspread client), spreadsheet and worksheet handles and
+        values cache, so no mutable client state is shared between threads. Only the credentials
+        object is shared, and populate_many refreshes it before starting workers.
+        """
+        worker = copy.copy(self)
+        worker.client = _RetryingClient(self.client.auth)
+        worker.client.timeout = self.client.timeout
+        worker.spreadsheet = copy.copy(self.spreadsheet)
+        worker.spreadsheet.client = worker.client
+        worker._worksheets = {
+            name: gspread.Worksheet(worker.spreadsheet, dict(worksheet._properties))
+            for name, worksheet in self._worksheets.items()
+        }
+        worker._values_cache = dict(self._values_cache)
+        return worker
+    
     def populate_heyreach_data(self, worksheet_name: str, heyreach_data: Dict, 
-                              date_range: Tuple[str, str]) -> Dict:
+                              date_range: Tuple[str, str], prepared: Optional[Dict] = None) -> Dict:
         """
         Populate HeyReach data into a worksheet
         
@@ -392,6 +861,7 @@ class SheetsClient:
             worksheet_name: Name of the worksheet
             heyreach_data: Data from HeyReach API (from get_sender_weekly_performance)
             date_range: Tuple of (start_date, end_date) in YYYY-MM-DD format
+            prepared: prepare_heyreach_data(heyreach_data), when the caller already built it
         
         Returns:
             Dictionary with results: {'updated': int, 'errors': List[str]}
@@ -399,40 +869,39 @@ class SheetsClient:
         results = {'updated': 0, 'errors': []}
         
         try:
-            worksheet = self.spreadsheet.worksheet(worksheet_name)
-            all_values = worksheet.get_all_values()
+            worksheet, all_values = self._get_ws(worksheet_name)
             
             # Parse sheet structure (date columns, senders, metric markers)
-            structure = self.parse_sheet_structure(worksheet_name)
+            structure = self.parse_sheet_structure(worksheet_name, all_values=all_values)
             
             if not structure['senders']:
                 results['errors'].append(f"No senders found in worksheet '{worksheet_name}'")
                 return results
             
-            metric_mapping = {
-                'connections_sent': ['connections sent'],
-                'connections_accepted': ['connections accepted'],
-                'acceptance_rate': ['acceptance rate'],
-                'messages_sent': ['messages sent'],
-                'message_replies': ['message replies'],
-                'reply_rate': ['reply rate'],
-                'open_conversations': ['open conversations'],
-                'interested': ['interested'],
-                'leads_not_enrolled': ['leads not yet enrolled', 'leads not enrolled']
-            }
+            if prepared is None:
+                prepared = prepare_heyreach_data(heyreach_data)
             
             # Determine which sender data to use based on worksheet title (client name)
-            sender_data_map = heyreach_data.get('senders', {}) or {}
-            clients_map = heyreach_data.get('clients', {}) or {}
+            heyreach_by_lower = prepared['senders']
             
             # If a client name matches (exact or partial) the worksheet title, scope to that client
             worksheet_title = worksheet_name.lower().strip()
-            for client_name, client_senders in clients_map.items():
-                client_title = str(client_name).lower().strip()
+            for client_title, client_senders in prepared['clients']:
                 if client_title == worksheet_title or client_title in worksheet_title or worksheet_title in client_title:
-                    sender_data_map = client_senders or {}
+                    heyreach_by_lower = client_senders
                     break
             
+            # Cells to write, flushed in one batch after all senders are processed
+            pending_cells = []
+            updated_cells = 0
+            # 1-indexed (row, col) of cells that already hold a value or are queued for one
+            filled_cells = {
+                (row_idx, col_idx)
+                for row_idx, row in enumerate(all_values, start=1)
+                for col_idx, cell in enumerate(row, start=1)
+                if cell.strip()
+            }
+            
             # Process each sender in the sheet
             for idx, sheet_sender in enumerate(structure['senders']):
                 sheet_sender_name = sheet_sender['name']
@@ -447,80 +916,53 @@ class SheetsClient:
                 
                 # Locate metric rows inside the sender block
                 metric_rows = self._get_metric_rows_for_sender(
-                    all_values=all_values,
+                    first_column_lower=structure['first_column_lower'],
                     start_row_idx=sender_row - 1,  # convert to 0-index
-                    end_row_idx=next_sender_row - 1,  # exclusive, 0-index
-                    metric_mapping=metric_mapping
+                    end_row_idx=next_sender_row - 1  # exclusive, 0-index
                 )
                 
-                # Find matching HeyReach sender
-                heyreach_sender_data = None
-                for heyreach_sender_name, weeks_data in sender_data_map.items():
-                    # Try exact match first
-                    if heyreach_sender_name.lower() == sheet_sender_name.lower():
-                        heyreach_sender_data = weeks_data
-                        break
-                    # Try partial match
-                    if sheet_sender_name.lower() in heyreach_sender_name.lower() or \
-                       heyreach_sender_name.lower() in sheet_sender_name.lower():
-                        heyreach_sender_data = weeks_data
-                        break
+                # Find matching HeyReach sender: exact match first, then partial match
+                sheet_sender_lower = sheet_sender_name.lower()
+                heyreach_sender_data = heyreach_by_lower.get(sheet_sender_lower)
+                if heyreach_sender_data is None:
+                    heyreach_sender_data = next(
+                        (weeks_data for heyreach_sender_lower, weeks_data in heyreach_by_lower.items()
+                         if sheet_sender_lower in heyreach_sender_lower or heyreach_sender_lower in sheet_sender_lower),
+                        None
+                    )
                 
                 if not heyreach_sender_data:
                     logger.debug(f"No HeyReach data found for sender '{sheet_sender_name}'")
                     continue
                 
                 # Populate each week separately into the correct date column
-                for week_data in heyreach_sender_data:
-                    week_end = week_data.get('week_end') or week_data.get('week_end_date') or week_data.get('weekStart')
-                    if not week_end:
-                        continue
-                    
-                    date_col = self._find_or_create_date_column(worksheet, structure, week_end)
+                for week_end, metric_values in heyreach_sender_data:
+                    date_col = self._find_or_create_date_column(worksheet, structure, week_end, pending_cells)
                     if not date_col:
                         continue
                     
-                    # Calculate rates for this week
-                    connections_sent = week_data.get('connections_sent', 0) or 0
-                    connections_accepted = week_data.get('connections_accepted', 0) or 0
-                    messages_sent = week_data.get('messages_sent', 0) or 0
-                    message_replies = week_data.get('message_replies', 0) or 0
-                    
-                    acceptance_rate = (connections_accepted / connections_sent * 100) if connections_sent > 0 else 0
-                    reply_rate = (message_replies / messages_sent * 100) if messages_sent > 0 else 0
-                    
-                    metric_values = {
-                        'connections_sent': int(connections_sent),
-                        'connections_accepted': int(connections_accepted),
-                        'acceptance_rate': f"{acceptance_rate:.2f}%",
-                        'messages_sent': int(messages_sent),
-                        'message_replies': int(message_replies),
-                        'reply_rate': f"{reply_rate:.2f}%",
-                        'open_conversations': int(week_data.get('open_conversations', 0) or 0),
-                        'interested': int(week_data.get('interested', 0) or 0),
-                        'leads_not_enrolled': int(week_data.get('leads_not_enrolled', 0) or 0)
-                    }
-                    
                     # Write values into metric rows for this sender/week
                     for heyreach_metric, value_to_write in metric_values.items():
                         metric_row = metric_rows.get(heyreach_metric)
                         if not metric_row:
                             continue
                         
-                        current_value = self.get_cell_value(worksheet_name, metric_row, date_col)
-                        
                         # Only update if empty to avoid overwriting
-                        if not current_value or current_value.strip() == '':
-                            try:
-                                self.update_cell(worksheet_name, metric_row, date_col, str(value_to_write))
-                                results['updated'] += 1
-                                logger.info(f"Updated {sheet_sender_name} week {week_end} - {heyreach_metric}: {value_to_write}")
-                            except Exception as e:
-                                error_msg = f"Error updating {sheet_sender_name} week {week_end} - {heyreach_metric}: {e}"
-                                results['errors'].append(error_msg)
-                                logger.error(error_msg)
+                        if (metric_row, date_col) not in filled_cells:
+                            filled_cells.add((metric_row, date_col))
+                            pending_cells.append(gspread.Cell(metric_row, date_col, str(value_to_write)))
+                            updated_cells += 1
+                            logger.info(f"Queued {sheet_sender_name} week {week_end} - {heyreach_metric}: {value_to_write}")
                         else:
-                            logger.debug(f"Skipping {sheet_sender_name} week {week_end} - {heyreach_metric} (already has value: {current_value})")
+                            logger.debug(f"Skipping {sheet_sender_name} week {week_end} - {heyreach_metric} (already has value)")
+            
+            try:
+                self._flush_pending_writes(worksheet, structure, pending_cells)
+                results['updated'] += updated_cells
+            except Exception as e:
+                error_msg = f"Error writing {len(pending_cells)} cells to '{worksheet_name}': {e}"
+                results['errors'].append(error_msg)
+                logger.error(error_msg)
             
             logger.info(f"Completed populating worksheet '{worksheet_name}': {results['updated']} cells updated")
             return results
@@ -528,8 +970,6 @@ class SheetsClient:
         except Exception as e:
             error_msg = f"Error populating HeyReach data: {e}"
             results['errors'].append(error_msg)
-            logger.error(error_msg)
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(error_msg)
             return results
 
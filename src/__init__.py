@@ -3,12 +3,18 @@ Outreach Reporting Automation
 Main package initialization
 """
 
-from .heyreach_client import HeyReachClient
-from .smartlead_client import SmartleadClient
-from .google_sheets_handler import GoogleSheetsHandler
-from .data_processor import DataProcessor
-from .report_generator import ReportGenerator
-from .email_sender import EmailSender
+import importlib
+
+# Exported name -> submodule that defines it. Submodules are imported on first
+# access, so callers that only need one client don't pay for gspread/pandas/plotly.
+_EXPORTS = {
+    'HeyReachClient': '.heyreach_client',
+    'SmartleadClient': '.smartlead_client',
+    'GoogleSheetsHandler': '.google_sheets_handler',
+    'DataProcessor': '.data_processor',
+    'ReportGenerator': '.report_generator',
+    'EmailSender': '.email_sender'
+}
 
 __all__ = [
     'HeyReachClient',
@@ -18,3 +24,12 @@ __all__ = [
     'ReportGenerator',
     'EmailSender'
 ]
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
@@ -3,6 +3,10 @@ Data Processor
 Processes and analyzes data from HeyReach and Smartlead
 """
 
+import csv
+import heapq
+import operator
+import os
 import pandas as pd
 from datetime import datetime
 from typing import Dict, List
@@ -12,13 +16,51 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Per-platform recommendation rules, checked in order: (data attribute, metric, comparison, threshold, message)
+_RECOMMENDATION_RULES = (
+    # LinkedIn recommendations
+    ('linkedin_data', 'acceptance_rate', operator.lt, 30,
+     "🎯 LinkedIn: Connection acceptance rate is below 30%. "
+     "Consider refining your connection request message and targeting."),
+    ('linkedin_data', 'reply_rate', operator.lt, 15,
+     "💬 LinkedIn: Reply rate is below 15%. "
+     "Test new message sequences and personalization strategies."),
+    # Email recommendations
+    ('email_data', 'open_rate', operator.lt, 40,
+     "📧 Email: Open rate is below 40%. "
+     "Test new subject lines and sender names."),
+    ('email_data', 'reply_rate', operator.lt, 8,
+     "✉️ Email: Reply rate is below 8%. "
+     "Improve personalization and value proposition in emails."),
+    ('email_data', 'bounce_rate', operator.gt, 5,
+     "⚠️ Email: Bounce rate is above 5%. "
+     "Clean your email list and verify email addresses before sending."),
+    # Deliverability check
+    ('email_data', 'delivery_rate', operator.lt, 95,
+     "🔧 Email: Delivery rate is below 95%. "
+     "Check email warming status and domain reputation."),
+)
+
+
+def _nlargest_by(campaigns: List[Dict], n: int, metric: str) -> List[Dict]:
+    """Top n campaigns by metric (ties keep input order); campaigns without the metric are skipped"""
+    ranked = [campaign for campaign in campaigns if campaign.get(metric) is not None]
+    return heapq.nlargest(n, ranked, key=operator.itemgetter(metric))
+
+
 class DataProcessor:
     """Process and analyze outreach data"""
     
+    __slots__ = ('linkedin_data', 'email_data', '_combined_cache', '_df_cache')
+    
     def __init__(self):
         """Initialize data processor"""
         self.linkedin_data = None
         self.email_data = None
+        # Combined metrics for the current data, computed once per process_data call
+        self._combined_cache = None
+        # DataFrames built by generate_dataframe for the current data, keyed by data_type
+        self._df_cache: Dict[str, pd.DataFrame] = {}
     
     def process_data(self, linkedin_data: Dict, email_data: Dict) -> Dict:
         """
@@ -33,8 +75,11 @@ class DataProcessor:
         """
         self.linkedin_data = linkedin_data
         self.email_data = email_data
+        self._combined_cache = None
+        self._df_cache.clear()
         
         combined_metrics = self._calculate_combined_metrics()
+        self._combined_cache = combined_metrics
         performance_summary = self._generate_performance_summary()
         recommendations = self._generate_recommendations()
         
@@ -49,43 +94,35 @@ class DataProcessor:
     
     def _calculate_combined_metrics(self) -> Dict:
         """Calculate combined metrics across both platforms"""
+        linkedin_data = self.linkedin_data
+        email_data = self.email_data
+        invites_sent = linkedin_data.get('total_invites_sent', 0)
+        emails_sent = email_data.get('total_emails_sent', 0)
         
         # Total outreach
-        total_outreach = (
-            self.linkedin_data.get('total_invites_sent', 0) + 
-            self.email_data.get('total_emails_sent', 0)
-        )
+        total_outreach = invites_sent + emails_sent
         
         # Total responses
-        total_responses = (
-            self.linkedin_data.get('total_replies', 0) + 
-            self.email_data.get('total_replied', 0)
-        )
-        
-        # Overall response rate
-        overall_response_rate = (
-            (total_responses / total_outreach * 100) if total_outreach > 0 else 0
-        )
+        total_responses = linkedin_data.get('total_replies', 0) + email_data.get('total_replied', 0)
         
         # Total active campaigns
-        total_campaigns = (
-            self.linkedin_data.get('total_campaigns', 0) + 
-            self.email_data.get('total_campaigns', 0)
-        )
+        total_campaigns = linkedin_data.get('total_campaigns', 0) + email_data.get('total_campaigns', 0)
+        
+        # Overall response rate and channel shares
+        if total_outreach > 0:
+            overall_response_rate = total_responses / total_outreach * 100
+            linkedin_percentage = invites_sent / total_outreach * 100
+            email_percentage = emails_sent / total_outreach * 100
+        else:
+            overall_response_rate = linkedin_percentage = email_percentage = 0
         
         return {
             'total_outreach_actions': total_outreach,
             'total_responses': total_responses,
             'overall_response_rate': round(overall_response_rate, 2),
             'total_active_campaigns': total_campaigns,
-            'linkedin_percentage': round(
-                (self.linkedin_data.get('total_invites_sent', 0) / total_outreach * 100) 
-                if total_outreach > 0 else 0, 2
-            ),
-            'email_percentage': round(
-                (self.email_data.get('total_emails_sent', 0) / total_outreach * 100) 
-                if total_outreach > 0 else 0, 2
-            )
+            'linkedin_percentage': round(linkedin_percentage, 2),
+            'email_percentage': round(email_percentage, 2)
         }
     
     def _generate_performance_summary(self) -> Dict:
@@ -139,57 +176,13 @@ class DataProcessor:
     def _generate_recommendations(self) -> List[str]:
         """Generate actionable recommendations based on data"""
         
-        recommendations = []
-        
-        # LinkedIn recommendations
-        linkedin_acceptance = self.linkedin_data.get('acceptance_rate', 0)
-        linkedin_reply = self.linkedin_data.get('reply_rate', 0)
-        
-        if linkedin_acceptance < 30:
-            recommendations.append(
-                "🎯 LinkedIn: Connection acceptance rate is below 30%. "
-                "Consider refining your connection request message and targeting."
-            )
-        
-        if linkedin_reply < 15:
-            recommendations.append(
-                "💬 LinkedIn: Reply rate is below 15%. "
-                "Test new message sequences and personalization strategies."
-            )
-        
-        # Email recommendations
-        email_open = self.email_data.get('open_rate', 0)
-        email_reply = self.email_data.get('reply_rate', 0)
-        email_bounce = self.email_data.get('bounce_rate', 0)
-        
-        if email_open < 40:
-            recommendations.append(
-                "📧 Email: Open rate is below 40%. "
-                "Test new subject lines and sender names."
-            )
-        
-        if email_reply < 8:
-            recommendations.append(
-                "✉️ Email: Reply rate is below 8%. "
-                "Improve personalization and value proposition in emails."
-            )
-        
-        if email_bounce > 5:
-            recommendations.append(
-                "⚠️ Email: Bounce rate is above 5%. "
-                "Clean your email list and verify email addresses before sending."
-            )
-        
-        # Deliverability check
-        delivery_rate = self.email_data.get('delivery_rate', 0)
-        if delivery_rate < 95:
-            recommendations.append(
-                "🔧 Email: Delivery rate is below 95%. "
-                "Check email warming status and domain reputation."
-            )
+        recommendations = [
+            message for source, field, compare, threshold, message in _RECOMMENDATION_RULES
+            if compare(getattr(self, source).get(field, 0), threshold)
+        ]
         
         # General recommendations
-        combined = self._calculate_combined_metrics()
+        combined = self._combined_cache or self._calculate_combined_metrics()
         if combined['overall_response_rate'] < 10:
             recommendations.append(
                 "📊 Overall: Response rate is below 10%. "
@@ -213,8 +206,12 @@ class DataProcessor:
             data_type: 'linkedin', 'email', or 'combined'
             
         Returns:
-            DataFrame with campaign data
+            DataFrame with campaign data (built once per process_data call and data_type)
         """
+        cached = self._df_cache.get(data_type)
+        if cached is not None:
+            return cached.copy(deep=False)
+        
         if data_type == 'linkedin':
             campaigns = self.linkedin_data.get('campaigns_data', [])
             df = pd.DataFrame(campaigns)
@@ -224,33 +221,91 @@ class DataProcessor:
             df = pd.DataFrame(campaigns)
             
         elif data_type == 'combined':
-            linkedin_campaigns = self.linkedin_data.get('campaigns_data', [])
-            email_campaigns = self.email_data.get('campaigns_data', [])
-            
-            # Add platform identifier
-            for camp in linkedin_campaigns:
-                camp['platform'] = 'LinkedIn'
-            for camp in email_campaigns:
-                camp['platform'] = 'Email'
+            # Tag each frame's platform column in one assignment (leaves the caller's dicts untouched)
+            frames = []
+            for campaigns, platform in ((self.linkedin_data.get('campaigns_data', []), 'LinkedIn'),
+                                        (self.email_data.get('campaigns_data', []), 'Email')):
+                if campaigns:
+                    frame = pd.DataFrame(campaigns)
+                    frame['platform'] = platform
+                    frames.append(frame)
             
-            df = pd.DataFrame(linkedin_campaigns + email_campaigns)
+            df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
         
         else:
             df = pd.DataFrame()
         
-        return df
+        self._df_cache[data_type] = df
+        return df.copy(deep=False)
+    
+    def _campaign_sources(self, data_type: str) -> List[tuple]:
+        """
+        Campaign lists behind a data type, each with the platform tag its rows get
+        
+        Args:
+            data_type: 'linkedin', 'email', or 'combined'
+            
+        Returns:
+            List of (campaigns, platform) pairs; platform is None when rows are not tagged
+        """
+        if data_type == 'linkedin':
+            return [(self.linkedin_data.get('campaigns_data', []), None)]
+        if data_type == 'email':
+            return [(self.email_data.get('campaigns_data', []), None)]
+        if data_type == 'combined':
+            return [(campaigns, platform) for campaigns, platform in (
+                (self.linkedin_data.get('campaigns_data', []), 'LinkedIn'),
+                (self.email_data.get('campaigns_data', []), 'Email')
+            ) if campaigns]
+        return []
+    
+    def get_campaign_records(self, data_type: str) -> List[Dict]:
+        """
+        Campaign records without building a DataFrame
+        
+        Args:
+            data_type: 'linkedin', 'email', or 'combined'
+            
+        Returns:
+            The platform's own campaign list for 'linkedin'/'email' (not a copy), or copies
+            tagged with 'platform' for 'combined'
+        """
+        sources = self._campaign_sources(data_type)
+        if len(sources) == 1 and sources[0][1] is None:
+            return sources[0][0]
+        return [dict(campaign, platform=platform) for campaigns, platform in sources for campaign in campaigns]
     
     def export_to_csv(self, output_path: str, data_type: str = 'combined'):
         """
         Export data to CSV file
         
+        Rows are streamed from the campaign dicts with csv.DictWriter, without building a DataFrame.
+        Columns follow the same first-seen order as generate_dataframe.
+        
         Args:
             output_path: Path to save CSV file
             data_type: Type of data to export
         """
         try:
-            df = self.generate_dataframe(data_type)
-            df.to_csv(output_path, index=False)
+            sources = self._campaign_sources(data_type)
+            
+            # Ordered union of keys (dict as an ordered set); 'platform' follows each tagged list's keys
+            fieldnames = {}
+            for campaigns, platform in sources:
+                for campaign in campaigns:
+                    fieldnames.update(dict.fromkeys(campaign))
+                if platform:
+                    fieldnames['platform'] = None
+            
+            rows = (
+                campaign if platform is None else dict(campaign, platform=platform)
+                for campaigns, platform in sources
+                for campaign in campaigns
+            )
+            with open(output_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=list(fieldnames), lineterminator=os.linesep)
+                writer.writeheader()
+                writer.writerows(rows)
             logger.info(f"✅ Data exported to {output_path}")
         except Exception as e:
             logger.error(f"Error exporting to CSV: {e}")
@@ -266,23 +321,9 @@ class DataProcessor:
         Returns:
             Dictionary with top LinkedIn and email campaigns
         """
-        # LinkedIn top campaigns
-        linkedin_campaigns = self.linkedin_data.get('campaigns_data', [])
-        linkedin_df = pd.DataFrame(linkedin_campaigns)
-        
-        if not linkedin_df.empty and 'reply_rate' in linkedin_df.columns:
-            top_linkedin = linkedin_df.nlargest(n, 'reply_rate').to_dict('records')
-        else:
-            top_linkedin = []
-        
-        # Email top campaigns
-        email_campaigns = self.email_data.get('campaigns_data', [])
-        email_df = pd.DataFrame(email_campaigns)
-        
-        if not email_df.empty and 'reply_rate' in email_df.columns:
-            top_email = email_df.nlargest(n, 'reply_rate').to_dict('records')
-        else:
-            top_email = []
+        # Partial heap selection over the existing dicts; no DataFrame build or full sort
+        top_linkedin = _nlargest_by(self.get_campaign_records('linkedin'), n, metric)
+        top_email = _nlargest_by(self.get_campaign_records('email'), n, metric)
         
         return {
             'top_linkedin_campaigns': top_linkedin,
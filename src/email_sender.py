@@ -3,117 +3,102 @@ Email Sender
 Sends automated email reports
 """
 
+import html
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.application import MIMEApplication
+from email.message import EmailMessage
 from datetime import datetime
-from typing import List, Dict
+from string import Template
+from typing import List, Dict, Optional, Tuple
 import logging
 import os
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Authenticated SMTP connections kept open between calls, keyed by server and credentials.
+# A cached connection is checked with NOOP and only re-established (TLS + AUTH) when that fails.
+_smtp_connections = {}
+_smtp_lock = threading.Lock()
 
-class EmailSender:
-    """Send email reports"""
-    
-    def __init__(self, smtp_server: str, smtp_port: int, sender_email: str, sender_password: str):
-        """
-        Initialize email sender
-        
-        Args:
-            smtp_server: SMTP server address
-            smtp_port: SMTP port number
-            sender_email: Sender email address
-            sender_password: Sender email password (use app password for Gmail)
-        """
-        self.smtp_server = smtp_server
-        self.smtp_port = smtp_port
-        self.sender_email = sender_email
-        self.sender_password = sender_password
-    
-    def send_report(self, recipient_emails: List[str], processed_data: Dict, attachment_path: str = None):
-        """
-        Send email report
-        
-        Args:
-            recipient_emails: List of recipient email addresses
-            processed_data: Processed data dictionary
-            attachment_path: Optional path to HTML report attachment
-        """
+
+def _close_smtp_connections():
+    """Close all cached SMTP connections"""
+    with _smtp_lock:
+        connections = list(_smtp_connections.values())
+        _smtp_connections.clear()
+    for server in connections:
         try:
-            # Create email body
-            email_body = self._create_email_body(processed_data)
-            
-            # Create message
-            msg = MIMEMultipart()
-            msg['From'] = self.sender_email
-            msg['To'] = ', '.join(recipient_emails)
-            msg['Subject'] = f"Outreach Performance Report - {datetime.now().strftime('%B %d, %Y')}"
-            
-            # Add body
-            msg.attach(MIMEText(email_body, 'html'))
-            
-            # Add attachment if provided
-            if attachment_path and os.path.exists(attachment_path):
-                with open(attachment_path, 'rb') as f:
-                    attachment = MIMEApplication(f.read(), _subtype='html')
-                    attachment.add_header('Content-Disposition', 'attachment', 
-                                        filename=f'outreach_report_{datetime.now().strftime("%Y%m%d")}.html')
-                    msg.attach(attachment)
-            
-            # Send email
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.sender_email, self.sender_password)
-                server.send_message(msg)
-            
-            logger.info(f"✅ Email report sent to {len(recipient_emails)} recipients")
-        except Exception as e:
-            logger.error(f"Error sending email report: {e}")
-    
-    def _create_email_body(self, data: Dict) -> str:
-        """Create HTML email body"""
-        
-        combined = data['combined_metrics']
-        performance = data['performance_summary']
-        recommendations = data['recommendations']
-        linkedin = data['linkedin']
-        email_data = data['email']
-        
-        html = f"""
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+
+
+atexit.register(_close_smtp_connections)
+
+# Rows of the LinkedIn and Email sections of the report email: (label, data key, value format)
+_LINKEDIN_ROWS = (
+    ('Invites Sent', 'total_invites_sent', '{:,}'),
+    ('Invites Accepted', 'total_invites_accepted', '{:,}'),
+    ('Acceptance Rate', 'acceptance_rate', '{}%'),
+    ('Messages Sent', 'total_messages_sent', '{:,}'),
+    ('Replies', 'total_replies', '{:,}'),
+    ('Reply Rate', 'reply_rate', '{}%'),
+)
+_EMAIL_ROWS = (
+    ('Emails Sent', 'total_emails_sent', '{:,}'),
+    ('Delivered', 'total_emails_delivered', '{:,}'),
+    ('Delivery Rate', 'delivery_rate', '{}%'),
+    ('Opened', 'total_opened', '{:,}'),
+    ('Open Rate', 'open_rate', '{}%'),
+    ('Replies', 'total_replied', '{:,}'),
+    ('Reply Rate', 'reply_rate', '{}%'),
+)
+_PERFORMANCE_ROW = """        <div class="performance-row">
+            <span>{}:</span>
+            <strong>{}</strong>
+        </div>"""
+
+
+def _performance_rows(rows: tuple, data: Dict) -> str:
+    """Render a section's performance rows from its row table"""
+    return '\n'.join(_PERFORMANCE_ROW.format(label, fmt.format(data[key])) for label, key, fmt in rows)
+
+
+# HTML email body; _create_email_body substitutes the formatted values
+_EMAIL_TEMPLATE = Template("""
 <!DOCTYPE html>
 <html>
 <head>
     <style>
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             line-height: 1.6;
             color: #333;
             max-width: 600px;
             margin: 0 auto;
             padding: 20px;
-        }}
+        }
         
-        .header {{
+        .header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 30px;
             text-align: center;
             border-radius: 10px;
             margin-bottom: 30px;
-        }}
+        }
         
-        .summary {{
+        .summary {
             background: #f8f9fa;
             padding: 20px;
             border-radius: 8px;
             margin-bottom: 20px;
-        }}
+        }
         
-        .metric {{
+        .metric {
             display: inline-block;
             width: 48%;
             padding: 15px;
@@ -122,156 +107,106 @@ class EmailSender:
             border-radius: 5px;
             text-align: center;
             box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-        }}
+        }
         
-        .metric-value {{
+        .metric-value {
             font-size: 2em;
             font-weight: bold;
             color: #667eea;
-        }}
+        }
         
-        .metric-label {{
+        .metric-label {
             color: #666;
             font-size: 0.9em;
             margin-top: 5px;
-        }}
+        }
         
-        .section {{
+        .section {
             margin-bottom: 30px;
-        }}
+        }
         
-        .section h2 {{
+        .section h2 {
             color: #667eea;
             border-bottom: 2px solid #667eea;
             padding-bottom: 10px;
             margin-bottom: 15px;
-        }}
+        }
         
-        .performance-row {{
+        .performance-row {
             display: flex;
             justify-content: space-between;
             padding: 10px;
             border-bottom: 1px solid #e0e0e0;
-        }}
+        }
         
-        .recommendations {{
+        .recommendations {
             background: #fff3cd;
             border-left: 4px solid #ffc107;
             padding: 15px;
             border-radius: 5px;
             margin: 20px 0;
-        }}
+        }
         
-        .recommendations h3 {{
+        .recommendations h3 {
             color: #856404;
             margin-bottom: 10px;
-        }}
+        }
         
-        .recommendation {{
+        .recommendation {
             padding: 8px 0;
             border-bottom: 1px solid #e0e0e0;
-        }}
+        }
         
-        .recommendation:last-child {{
+        .recommendation:last-child {
             border-bottom: none;
-        }}
+        }
         
-        .footer {{
+        .footer {
             text-align: center;
             padding: 20px;
             color: #999;
             font-size: 0.9em;
-        }}
+        }
     </style>
 </head>
 <body>
     <div class="header">
         <h1>📊 Outreach Performance Report</h1>
-        <p>{datetime.now().strftime('%B %d, %Y')}</p>
+        <p>$report_date</p>
     </div>
     
     <div class="summary">
         <div class="metric">
-            <div class="metric-value">{combined['total_outreach_actions']:,}</div>
+            <div class="metric-value">$total_outreach_actions</div>
             <div class="metric-label">Total Outreach</div>
         </div>
         <div class="metric">
-            <div class="metric-value">{combined['total_responses']:,}</div>
+            <div class="metric-value">$total_responses</div>
             <div class="metric-label">Total Responses</div>
         </div>
         <div class="metric">
-            <div class="metric-value">{combined['overall_response_rate']}%</div>
+            <div class="metric-value">$overall_response_rate%</div>
             <div class="metric-label">Response Rate</div>
         </div>
         <div class="metric">
-            <div class="metric-value">{combined['total_active_campaigns']}</div>
+            <div class="metric-value">$total_active_campaigns</div>
             <div class="metric-label">Active Campaigns</div>
         </div>
     </div>
     
     <div class="section">
         <h2>💼 LinkedIn Performance</h2>
-        <div class="performance-row">
-            <span>Invites Sent:</span>
-            <strong>{linkedin['total_invites_sent']:,}</strong>
-        </div>
-        <div class="performance-row">
-            <span>Invites Accepted:</span>
-            <strong>{linkedin['total_invites_accepted']:,}</strong>
-        </div>
-        <div class="performance-row">
-            <span>Acceptance Rate:</span>
-            <strong>{linkedin['acceptance_rate']}%</strong>
-        </div>
-        <div class="performance-row">
-            <span>Messages Sent:</span>
-            <strong>{linkedin['total_messages_sent']:,}</strong>
-        </div>
-        <div class="performance-row">
-            <span>Replies:</span>
-            <strong>{linkedin['total_replies']:,}</strong>
-        </div>
-        <div class="performance-row">
-            <span>Reply Rate:</span>
-            <strong>{linkedin['reply_rate']}%</strong>
-        </div>
+$linkedin_rows
     </div>
     
     <div class="section">
         <h2>📧 Email Performance</h2>
-        <div class="performance-row">
-            <span>Emails Sent:</span>
-            <strong>{email_data['total_emails_sent']:,}</strong>
-        </div>
-        <div class="performance-row">
-            <span>Delivered:</span>
-            <strong>{email_data['total_emails_delivered']:,}</strong>
-        </div>
-        <div class="performance-row">
-            <span>Delivery Rate:</span>
-            <strong>{email_data['delivery_rate']}%</strong>
-        </div>
-        <div class="performance-row">
-            <span>Opened:</span>
-            <strong>{email_data['total_opened']:,}</strong>
-        </div>
-        <div class="performance-row">
-            <span>Open Rate:</span>
-            <strong>{email_data['open_rate']}%</strong>
-        </div>
-        <div class="performance-row">
-            <span>Replies:</span>
-            <strong>{email_data['total_replied']:,}</strong>
-        </div>
-        <div class="performance-row">
-            <span>Reply Rate:</span>
-            <strong>{email_data['reply_rate']}%</strong>
-        </div>
+$email_rows
     </div>
     
     <div class="recommendations">
         <h3>💡 Recommendations</h3>
-        {''.join([f'<div class="recommendation">{rec}</div>' for rec in recommendations])}
+        $recommendations
     </div>
     
     <div class="footer">
@@ -280,9 +215,207 @@ class EmailSender:
     </div>
 </body>
 </html>
+        """)
+
+
+class EmailSender:
+    """Send email reports"""
+    
+    __slots__ = ('smtp_server', 'smtp_port', 'sender_email', 'sender_password', 'timeout')
+    
+    def __init__(self, smtp_server: str, smtp_port: int, sender_email: str, sender_password: str,
+                 timeout: float = None):
         """
+        Initialize email sender
         
-        return html
+        Args:
+            smtp_server: SMTP server address
+            smtp_port: SMTP port number
+            sender_email: Sender email address
+            sender_password: Sender email password (use app password for Gmail)
+            timeout: Optional socket timeout in seconds for SMTP connections
+        """
+        self.smtp_server = smtp_server
+        self.smtp_port = smtp_port
+        self.sender_email = sender_email
+        self.sender_password = sender_password
+        self.timeout = timeout
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Close this sender's cached SMTP connection, if any"""
+        with _smtp_lock:
+            server = _smtp_connections.pop(self._connection_key(), None)
+        if server is not None:
+            try:
+                server.quit()
+            except (smtplib.SMTPException, OSError):
+                server.close()
+    
+    def send_report(self, recipient_emails: List[str], processed_data: Dict, attachment_path: str = None):
+        """
+        Send email report
+        
+        Args:
+            recipient_emails: List of recipient email addresses
+            processed_data: Processed data dictionary
+            attachment_path: Optional path to HTML report attachment
+        """
+        try:
+            msg = self._build_message(recipient_emails, self._create_email_body(processed_data),
+                                      self._read_attachment(attachment_path))
+            
+            # Send email
+            server = self._send_message(self._acquire_connection(), msg)
+            self._release_connection(server)
+            
+            logger.info(f"✅ Email report sent to {len(recipient_emails)} recipients")
+        except Exception as e:
+            logger.error(f"Error sending email report: {e}")
+    
+    def send_report_bulk(self, reports: List[Tuple[List[str], Dict]], attachment_path: str = None,
+                         max_workers: int = 4) -> int:
+        """
+        Send several reports concurrently, e.g. one personalized report per recipient group
+        
+        Each worker thread holds its own SMTP connection for its share of the reports. Bodies are
+        rendered once per distinct processed_data and the attachment is read once.
+        
+        Args:
+            reports: List of (recipient_emails, processed_data) pairs, one message each
+            attachment_path: Optional path to HTML report attached to every message
+            max_workers: Maximum concurrent SMTP connections
+            
+        Returns:
+            Number of messages sent
+        """
+        if not reports:
+            return 0
+        
+        try:
+            attachment = self._read_attachment(attachment_path)
+            bodies = {}
+            messages = []
+            for recipient_emails, processed_data in reports:
+                if id(processed_data) not in bodies:
+                    bodies[id(processed_data)] = self._create_email_body(processed_data)
+                messages.append(self._build_message(recipient_emails, bodies[id(processed_data)], attachment))
+        except Exception as e:
+            logger.error(f"Error building email reports: {e}")
+            return 0
+        
+        def send_shard(shard):
+            sent = 0
+            try:
+                server = self._acquire_connection()
+            except Exception as e:
+                logger.error(f"Error connecting to SMTP server: {e}")
+                return 0
+            for msg in shard:
+                try:
+                    server = self._send_message(server, msg)
+                    sent += 1
+                except Exception as e:
+                    logger.error(f"Error sending email report to {msg['To']}: {e}")
+                    try:
+                        server = self._acquire_connection()
+                    except Exception as reconnect_error:
+                        logger.error(f"Error reconnecting to SMTP server: {reconnect_error}")
+                        return sent
+            self._release_connection(server)
+            return sent
+        
+        workers = min(max_workers, len(messages))
+        shards = [messages[i::workers] for i in range(workers)]
+        if workers == 1:
+            total_sent = send_shard(shards[0])
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                total_sent = sum(executor.map(send_shard, shards))
+        
+        logger.info(f"✅ Sent {total_sent} of {len(messages)} email reports")
+        return total_sent
+    
+    def _read_attachment(self, attachment_path: Optional[str]) -> Optional[Tuple[str, bytes]]:
+        """Read the HTML report to attach, returning (filename, content) or None if there is none"""
+        if not attachment_path or not os.path.exists(attachment_path):
+            return None
+        filename = f'outreach_report_{datetime.now().strftime("%Y%m%d")}.html'
+        with open(attachment_path, 'rb') as f:
+            return filename, f.read()
+    
+    def _build_message(self, recipient_emails: List[str], email_body: str,
+                       attachment: Optional[Tuple[str, bytes]] = None) -> EmailMessage:
+        """Build the report message for recipient_emails"""
+        msg = EmailMessage()
+        msg['From'] = self.sender_email
+        msg['To'] = ', '.join(recipient_emails)
+        msg['Subject'] = f"Outreach Performance Report - {datetime.now().strftime('%B %d, %Y')}"
+        
+        # Add body
+        msg.set_content(email_body, subtype='html')
+        
+        # Add attachment if provided (add_attachment turns the message into multipart/mixed)
+        if attachment:
+            filename, report_bytes = attachment
+            # ReportGenerator writes reports as UTF-8
+            msg.add_attachment(report_bytes, maintype='text', subtype='html', filename=filename,
+                               params={'charset': 'utf-8'})
+        return msg
+    
+    def _send_message(self, server: smtplib.SMTP, msg: EmailMessage) -> smtplib.SMTP:
+        """
+        Send msg over server, replacing the connection once if the server dropped it
+        
+        Returns:
+            The live connection to keep using (a new one after a reconnect)
+        
+        Raises:
+            The send error; the failed connection is closed first
+        """
+        try:
+            server.send_message(msg)
+            return server
+        except smtplib.SMTPServerDisconnected:
+            # A cached connection can pass NOOP and still be dropped before the send
+            server.close()
+        except Exception:
+            server.close()
+            raise
+        
+        server = self._acquire_connection()
+        try:
+            server.send_message(msg)
+        except Exception:
+            server.close()
+            raise
+        return server
+    
+    def _create_email_body(self, data: Dict) -> str:
+        """Create HTML email body"""
+        
+        combined = data['combined_metrics']
+        performance = data['performance_summary']
+        recommendations = data['recommendations']
+        linkedin = data['linkedin']
+        email_data = data['email']
+        
+        # Values are formatted here; the markup itself is parsed once, at import
+        return _EMAIL_TEMPLATE.substitute(
+            report_date=datetime.now().strftime('%B %d, %Y'),
+            total_outreach_actions=f"{combined['total_outreach_actions']:,}",
+            total_responses=f"{combined['total_responses']:,}",
+            overall_response_rate=combined['overall_response_rate'],
+            total_active_campaigns=combined['total_active_campaigns'],
+            linkedin_rows=_performance_rows(_LINKEDIN_ROWS, linkedin),
+            email_rows=_performance_rows(_EMAIL_ROWS, email_data),
+            recommendations=''.join(f'<div class="recommendation">{html.escape(rec)}</div>' for rec in recommendations)
+        )
     
     def test_connection(self) -> bool:
         """
@@ -292,12 +425,52 @@ class EmailSender:
             True if connection successful, False otherwise
         """
         try:
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.sender_email, self.sender_password)
+            self._release_connection(self._acquire_connection())
             
             logger.info("✅ Email connection successful")
             return True
         except Exception as e:
             logger.error(f"❌ Email connection failed: {e}")
             return False
+    
+    def _connection_key(self) -> tuple:
+        """Cache key for this sender's SMTP connection"""
+        return (self.smtp_server, self.smtp_port, self.sender_email, self.sender_password)
+    
+    def _acquire_connection(self) -> smtplib.SMTP:
+        """
+        Take a live, authenticated SMTP connection
+        
+        Reuses the cached connection if it still answers NOOP, otherwise connects,
+        upgrades to TLS and logs in.
+        
+        Returns:
+            Connection owned by the caller until passed to _release_connection
+        """
+        with _smtp_lock:
+            server = _smtp_connections.pop(self._connection_key(), None)
+        
+        if server is not None:
+            try:
+                if server.noop()[0] == 250:
+                    return server
+            except (smtplib.SMTPException, OSError):
+                pass
+            server.close()
+        
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=self.timeout)
+        try:
+            server.starttls()
+            server.login(self.sender_email, self.sender_password)
+        except Exception:
+            server.close()
+            raise
+        return server
+    
+    def _release_connection(self, server: smtplib.SMTP):
+        """Return a healthy connection to the cache for the next call"""
+        with _smtp_lock:
+            previous = _smtp_connections.get(self._connection_key())
+            _smtp_connections[self._connection_key()] = server
+        if previous is not None:
+            previous.close()
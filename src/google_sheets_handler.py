@@ -4,6 +4,7 @@ Handles writing outreach data to Google Sheets for live dashboards
 """
 
 import gspread
+from gspread.utils import a1_range_to_grid_range
 from oauth2client.service_account import ServiceAccountCredentials
 from datetime import datetime
 from typing import Dict, List
@@ -16,16 +17,18 @@ logger = logging.getLogger(__name__)
 class GoogleSheetsHandler:
     """Handler for Google Sheets integration"""
     
-    def __init__(self, credentials_file: str, spreadsheet_id: str):
+    def __init__(self, credentials_file: str, spreadsheet_id: str, timeout=None):
         """
         Initialize Google Sheets handler
         
         Args:
             credentials_file: Path to Google service account JSON credentials
             spreadsheet_id: Google Sheets spreadsheet ID
+            timeout: Optional Sheets API request timeout in seconds, or a (connect, read) tuple
         """
         self.credentials_file = credentials_file
         self.spreadsheet_id = spreadsheet_id
+        self.timeout = timeout
         self.client = None
         self.spreadsheet = None
         
@@ -42,6 +45,8 @@ class GoogleSheetsHandler:
                 scope
             )
             self.client = gspread.authorize(creds)
+            if self.timeout is not None:
+                self.client.set_timeout(self.timeout)
             self.spreadsheet = self.client.open_by_key(self.spreadsheet_id)
             
             logger.info("✅ Google Sheets authentication successful")
@@ -56,21 +61,37 @@ class GoogleSheetsHandler:
             self.authenticate()
         
         try:
-            # Create Overview sheet
-            overview_sheet = self._get_or_create_worksheet("Overview")
-            self._setup_overview_sheet(overview_sheet)
+            # One metadata read, then every addSheet/header/format change in a single batchUpdate
+            sheet_ids = {ws.title: ws.id for ws in self.spreadsheet.worksheets()}
+            next_id = max(sheet_ids.values(), default=0) + 1
             
-            # Create LinkedIn Details sheet
-            linkedin_sheet = self._get_or_create_worksheet("LinkedIn Campaigns")
-            self._setup_linkedin_sheet(linkedin_sheet)
-            
-            # Create Email Details sheet
-            email_sheet = self._get_or_create_worksheet("Email Campaigns")
-            self._setup_email_sheet(email_sheet)
+            requests = []
+            for title, rows, format_range, cell_format in self._dashboard_template():
+                if title not in sheet_ids:
+                    sheet_ids[title] = next_id
+                    next_id += 1
+                    requests.append({'addSheet': {'properties': {
+                        'sheetId': sheet_ids[title],
+                        'title': title,
+                        'gridProperties': {'rowCount': 1000, 'columnCount': 26}
+                    }}})
+                
+                sheet_id = sheet_ids[title]
+                for row_index, row in enumerate(rows):
+                    if row:
+                        requests.append({'updateCells': {
+                            'start': {'sheetId': sheet_id, 'rowIndex': row_index, 'columnIndex': 0},
+                            'rows': [{'values': [{'userEnteredValue': {'stringValue': str(value)}} for value in row]}],
+                            'fields': 'userEnteredValue'
+                        }})
+                
+                requests.append({'repeatCell': {
+                    'range': a1_range_to_grid_range(format_range, sheet_id),
+                    'cell': {'userEnteredFormat': cell_format},
+                    'fields': 'userEnteredFormat(%s)' % ','.join(cell_format.keys())
+                }})
             
-            # Create Historical Data sheet
-            history_sheet = self._get_or_create_worksheet("Historical Data")
-            self._setup_history_sheet(history_sheet)
+            self.spreadsheet.batch_update({'requests': requests})
             
             logger.info("✅ Dashboard template created successfully")
             return True
@@ -78,79 +99,48 @@ class GoogleSheetsHandler:
             logger.error(f"Error creating dashboard template: {e}")
             return False
     
-    def _get_or_create_worksheet(self, title: str):
-        """Get existing worksheet or create new one"""
-        try:
-            worksheet = self.spreadsheet.worksheet(title)
-        except gspread.exceptions.WorksheetNotFound:
-            worksheet = self.spreadsheet.add_worksheet(title=title, rows=1000, cols=26)
-        return worksheet
-    
-    def _setup_overview_sheet(self, sheet):
-        """Setup overview sheet with headers and formatting"""
-        headers = [
-            ["OUTREACH PERFORMANCE DASHBOARD"],
-            ["Last Updated:", datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
-            [],
-            ["SUMMARY METRICS"],
-            [],
-            ["Platform", "Campaigns", "Sent", "Delivered/Accepted", "Opened/Messages", "Replied", "Reply Rate"],
+    def _dashboard_template(self) -> List[tuple]:
+        """(title, header rows from row 1, header format range, header format) for each dashboard sheet"""
+        white_bold = {'bold': True, 'foregroundColor': {'red': 1, 'green': 1, 'blue': 1}}
+        return [
+            ("Overview", [
+                ["OUTREACH PERFORMANCE DASHBOARD"],
+                ["Last Updated:", datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
+                [],
+                ["SUMMARY METRICS"],
+                [],
+                ["Platform", "Campaigns", "Sent", "Delivered/Accepted", "Opened/Messages", "Replied", "Reply Rate"],
+            ], 'A1:G1', {
+                'backgroundColor': {'red': 0.2, 'green': 0.2, 'blue': 0.8},
+                'textFormat': white_bold,
+                'horizontalAlignment': 'CENTER'
+            }),
+            ("LinkedIn Campaigns", [[
+                "Campaign ID", "Campaign Name", "Status", "Invites Sent", 
+                "Invites Accepted", "Acceptance Rate %", "Messages Sent", 
+                "Replies", "Reply Rate %", "Last Updated"
+            ]], 'A1:J1', {
+                'backgroundColor': {'red': 0.2, 'green': 0.5, 'blue': 0.8},
+                'textFormat': white_bold
+            }),
+            ("Email Campaigns", [[
+                "Campaign ID", "Campaign Name", "Status", "Emails Sent", 
+                "Delivered", "Delivery Rate %", "Opened", "Open Rate %", 
+                "Clicked", "Click Rate %", "Replied", "Reply Rate %", 
+                "Bounced", "Unsubscribed", "Last Updated"
+            ]], 'A1:O1', {
+                'backgroundColor': {'red': 0.8, 'green': 0.3, 'blue': 0.3},
+                'textFormat': white_bold
+            }),
+            ("Historical Data", [[
+                "Date", "LinkedIn Invites", "LinkedIn Acceptance Rate", 
+                "LinkedIn Reply Rate", "Emails Sent", "Email Open Rate", 
+                "Email Reply Rate"
+            ]], 'A1:G1', {
+                'backgroundColor': {'red': 0.3, 'green': 0.7, 'blue': 0.3},
+                'textFormat': white_bold
+            }),
         ]
-        
-        # Write headers
-        for i, row in enumerate(headers, 1):
-            if row:
-                sheet.update(f'A{i}', [row])
-        
-        # Format header row
-        sheet.format('A1:G1', {
-            'backgroundColor': {'red': 0.2, 'green': 0.2, 'blue': 0.8},
-            'textFormat': {'bold': True, 'foregroundColor': {'red': 1, 'green': 1, 'blue': 1}},
-            'horizontalAlignment': 'CENTER'
-        })
-    
-    def _setup_linkedin_sheet(self, sheet):
-        """Setup LinkedIn campaigns sheet"""
-        headers = [[
-            "Campaign ID", "Campaign Name", "Status", "Invites Sent", 
-            "Invites Accepted", "Acceptance Rate %", "Messages Sent", 
-            "Replies", "Reply Rate %", "Last Updated"
-        ]]
-        sheet.update('A1', headers)
-        
-        sheet.format('A1:J1', {
-            'backgroundColor': {'red': 0.2, 'green': 0.5, 'blue': 0.8},
-            'textFormat': {'bold': True, 'foregroundColor': {'red': 1, 'green': 1, 'blue': 1}}
-        })
-    
-    def _setup_email_sheet(self, sheet):
-        """Setup email campaigns sheet"""
-        headers = [[
-            "Campaign ID", "Campaign Name", "Status", "Emails Sent", 
-            "Delivered", "Delivery Rate %", "Opened", "Open Rate %", 
-            "Clicked", "Click Rate %", "Replied", "Reply Rate %", 
-            "Bounced", "Unsubscribed", "Last Updated"
-        ]]
-        sheet.update('A1', headers)
-        
-        sheet.format('A1:O1', {
-            'backgroundColor': {'red': 0.8, 'green': 0.3, 'blue': 0.3},
-            'textFormat': {'bold': True, 'foregroundColor': {'red': 1, 'green': 1, 'blue': 1}}
-        })
-    
-    def _setup_history_sheet(self, sheet):
-        """Setup historical data tracking sheet"""
-        headers = [[
-            "Date", "LinkedIn Invites", "LinkedIn Acceptance Rate", 
-            "LinkedIn Reply Rate", "Emails Sent", "Email Open Rate", 
-            "Email Reply Rate"
-        ]]
-        sheet.update('A1', headers)
-        
-        sheet.format('A1:G1', {
-            'backgroundColor': {'red': 0.3, 'green': 0.7, 'blue': 0.3},
-            'textFormat': {'bold': True, 'foregroundColor': {'red': 1, 'green': 1, 'blue': 1}}
-        })
     
     def update_overview(self, linkedin_data: Dict, email_data: Dict):
         """
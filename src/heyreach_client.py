@@ -8,6 +8,7 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 import logging
 import json
+from .http_session import get_shared_session
 
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -19,16 +20,21 @@ logging.getLogger('urllib3').setLevel(logging.WARNING)
 class HeyReachClient:
     """Client for interacting with HeyReach API"""
     
-    def __init__(self, api_key: str, base_url: str = "https://api.heyreach.io"):
+    def __init__(self, api_key: str, base_url: str = "https://api.heyreach.io", timeout=30,
+                 session: requests.Session = None):
         """
         Initialize HeyReach client
         
         Args:
             api_key: HeyReach API key
             base_url: Base URL for HeyReach API
+            timeout: Request timeout in seconds, or a (connect, read) tuple
+            session: Optional requests.Session to send requests through (defaults to the shared pooled session)
         """
         self.api_key = api_key
         self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.session = session or get_shared_session()
         self.headers = {
             "X-API-KEY": api_key,
             "Content-Type": "application/json",
@@ -56,13 +62,13 @@ class HeyReachClient:
         request_headers = headers or self.headers
         
         try:
-            response = requests.request(
+            response = self.session.request(
                 method=method,
                 url=url,
                 headers=request_headers,
                 params=params,
                 json=data,
-                timeout=30
+                timeout=self.timeout
             )
             
             # Log detailed error information for debugging
@@ -444,9 +450,8 @@ class HeyReachClient:
                 logger.debug(f"GetOverallStats response: {json.dumps(data, indent=2, default=str)[:1000]}")
             return data if data else {}
         except Exception as e:
-            logger.error(f"Error fetching overall stats: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            # Can fire once per sender-week during rate-limit storms; only format the traceback at DEBUG
+            logger.error("Error fetching overall stats: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return {}
     
     def get_sender_weekly_performance(self, sender_id: str = None, start_date: str = None, 
@@ -0,0 +1,49 @@
+"""
+HTTP Session
+Shared requests.Session with connection pooling for the API clients
+"""
+
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_shared_session = None
+_shared_session_lock = threading.Lock()
+
+
+def create_session(pool_connections: int = 4, pool_maxsize: int = 16, retries: int = 2) -> requests.Session:
+    """
+    Create a session with a pooled HTTPAdapter
+
+    Args:
+        pool_connections: Number of per-host connection pools to keep
+        pool_maxsize: Maximum connections kept alive per host
+        retries: Retries for connection-level failures
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=retries, backoff_factor=0.2)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_shared_session() -> requests.Session:
+    """
+    Get the process-wide session, creating it on first use
+
+    Clients built without an explicit session share this one, so repeated runs
+    (e.g. from the scheduler) reuse open TCP/TLS connections.
+    """
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = create_session()
+        return _shared_session
@@ -5,26 +5,37 @@ Handles all interactions with Smartlead API for email outreach data
 
 import requests
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from operator import itemgetter
+from typing import Dict, Iterator, List, Optional, Tuple
 import logging
+from concurrent_fetch import iter_indexed_results
+from .http_session import get_shared_session
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Concurrent per-campaign stats requests in get_all_campaign_stats
+STATS_MAX_WORKERS = 8
+
 
 class SmartleadClient:
     """Client for interacting with Smartlead API"""
     
-    def __init__(self, api_key: str, base_url: str = "https://server.smartlead.ai/api/v1"):
+    def __init__(self, api_key: str, base_url: str = "https://server.smartlead.ai/api/v1", timeout=30,
+                 session: requests.Session = None):
         """
         Initialize Smartlead client
         
         Args:
             api_key: Smartlead API key
             base_url: Base URL for Smartlead API
+            timeout: Request timeout in seconds, or a (connect, read) tuple
+            session: Optional requests.Session to send requests through (defaults to the shared pooled session)
         """
         self.api_key = api_key
         self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.session = session or get_shared_session()
         self.headers = {
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
@@ -51,12 +62,12 @@ class SmartleadClient:
         params['api_key'] = self.api_key
         
         try:
-            response = requests.request(
+            response = self.session.request(
                 method=method,
                 url=url,
                 params=params,
                 json=data,
-                timeout=30
+                timeout=self.timeout
             )
             response.raise_for_status()
             return response.json()
@@ -88,31 +99,47 @@ class SmartleadClient:
         logger.info(f"Fetching stats for campaign {campaign_id}...")
         return self._make_request(f"campaigns/{campaign_id}/analytics")
     
+    def _campaign_with_stats(self, campaign: Dict) -> Dict:
+        """Combine campaign info with its statistics"""
+        return {
+            'campaign_id': campaign['id'],
+            'campaign_name': campaign.get('name', 'Unknown'),
+            'status': campaign.get('status', 'unknown'),
+            **self.get_campaign_stats(campaign_id=campaign['id'])
+        }
+    
+    def _iter_indexed_campaign_stats(self) -> Iterator[Tuple[int, Dict]]:
+        """
+        Yield (campaign index, statistics) pairs as each request completes
+        
+        Yields:
+            Index into the campaign list and campaign info combined with its statistics
+        """
+        campaigns = [campaign for campaign in self.get_campaigns() if campaign.get('id')]
+        return iter_indexed_results(campaigns, self._campaign_with_stats, STATS_MAX_WORKERS)
+    
+    def iter_campaign_stats(self) -> Iterator[Dict]:
+        """
+        Yield statistics for each campaign as it is fetched
+        
+        Results arrive in completion order, not campaign order; use
+        get_all_campaign_stats when order matters.
+        
+        Yields:
+            Campaign info combined with its statistics
+        """
+        for _, stats in self._iter_indexed_campaign_stats():
+            yield stats
+    
     def get_all_campaign_stats(self) -> List[Dict]:
         """
         Get statistics for all campaigns
         
         Returns:
-            List of campaign statistics
-        """
-        campaigns = self.get_campaigns()
-        all_stats = []
-        
-        for campaign in campaigns:
-            campaign_id = campaign.get('id')
-            if campaign_id:
-                stats = self.get_campaign_stats(campaign_id=campaign_id)
-                
-                # Combine campaign info with stats
-                combined = {
-                    'campaign_id': campaign_id,
-                    'campaign_name': campaign.get('name', 'Unknown'),
-                    'status': campaign.get('status', 'unknown'),
-                    **stats
-                }
-                all_stats.append(combined)
-        
-        return all_stats
+            List of campaign statistics in campaign order
+        """
+        indexed = sorted(self._iter_indexed_campaign_stats(), key=itemgetter(0))
+        return [stats for _, stats in indexed]
     
     def get_leads(self, campaign_id: str = None, status: str = None) -> List[Dict]:
         """
@@ -146,19 +173,22 @@ class SmartleadClient:
         data = self._make_request("email-accounts")
         return data.get('email_accounts', []) if isinstance(data, dict) else []
     
-    def get_summary_metrics(self, days_back: int = 7) -> Dict:
+    def get_summary_metrics(self, days_back: int = 7, include_campaigns_data: bool = True) -> Dict:
         """
         Get summary metrics across all campaigns
         
         Args:
             days_back: Number of days to look back (for filtering recent data)
+            include_campaigns_data: Keep each campaign's stats in 'campaigns_data'; when False
+                only the totals are kept and 'campaigns_data' is empty
             
         Returns:
             Summary metrics dictionary
         """
-        campaigns_stats = self.get_all_campaign_stats()
+        campaigns_stats = []
+        total_campaigns = 0
         
-        # Aggregate metrics
+        # Aggregate metrics as campaigns arrive
         total_sent = 0
         total_delivered = 0
         total_opened = 0
@@ -167,7 +197,10 @@ class SmartleadClient:
         total_bounced = 0
         total_unsubscribed = 0
         
-        for campaign in campaigns_stats:
+        for index, campaign in self._iter_indexed_campaign_stats():
+            total_campaigns += 1
+            if include_campaigns_data:
+                campaigns_stats.append((index, campaign))
             total_sent += campaign.get('emails_sent', 0)
             total_delivered += campaign.get('emails_delivered', 0)
             total_opened += campaign.get('emails_opened', 0)
@@ -176,6 +209,9 @@ class SmartleadClient:
             total_bounced += campaign.get('bounced', 0)
             total_unsubscribed += campaign.get('unsubscribed', 0)
         
+        # Restore campaign order for the per-campaign rows
+        campaigns_stats.sort(key=itemgetter(0))
+        
         # Calculate rates
         delivery_rate = (total_delivered / total_sent * 100) if total_sent > 0 else 0
         open_rate = (total_opened / total_delivered * 100) if total_delivered > 0 else 0
@@ -186,7 +222,7 @@ class SmartleadClient:
         return {
             'platform': 'Email (Smartlead)',
             'date_range_days': days_back,
-            'total_campaigns': len(campaigns_stats),
+            'total_campaigns': total_campaigns,
             'total_emails_sent': total_sent,
             'total_emails_delivered': total_delivered,
             'delivery_rate': round(delivery_rate, 2),
@@ -199,7 +235,7 @@ class SmartleadClient:
             'total_bounced': total_bounced,
             'bounce_rate': round(bounce_rate, 2),
             'total_unsubscribed': total_unsubscribed,
-            'campaigns_data': campaigns_stats
+            'campaigns_data': [campaign for _, campaign in campaigns_stats]
         }
     
     def test_connection(self) -> bool:
@@ -0,0 +1,77 @@
+"""
+Sheet structure parsing tests
+Run with: python -m unittest discover -s tests -t .
+"""
+
+import unittest
+
+import sheets_client
+from sheets_client import SheetsClient
+
+
+def _client() -> SheetsClient:
+    """SheetsClient that never touches the network (values are passed in directly)"""
+    client = SheetsClient.__new__(SheetsClient)
+    client._worksheets = {}
+    client._values_cache = {}
+    client.spreadsheet_id = 'test-spreadsheet'
+    return client
+
+
+def _header_grid():
+    """Sheet with metric column headers in a header row (one alias of the 'leads not enrolled' metric)"""
+    header = ['Sender', 'Connections Sent', 'Connections Accepted', 'Acceptance Rate', 'Messages Sent',
+              'Message Replies', 'Reply Rate', 'Open Conversations', 'Interested', 'Leads Not Enrolled']
+    rows = [['2025'] + [''] * 9, ['Week', '12/28/2024', '01/04/2025'] + [''] * 7, header]
+    for name in ('John Smith', 'Jane Doe', 'Bob Stone'):
+        rows.append([name] + ['1'] * 9)
+    return rows
+
+
+class BuildSheetStructureTest(unittest.TestCase):
+    
+    def test_column_scan_stops_once_every_metric_group_matches(self):
+        grid = _header_grid()
+        structure, read_rows = _client()._build_sheet_structure(grid)
+        
+        # Only the year, date and metric header rows are read cell by cell
+        self.assertEqual(read_rows, (0, 1, 2))
+        self.assertEqual(structure['metrics']['leads not enrolled'], 10)
+        self.assertNotIn('leads not yet enrolled', structure['metrics'])
+        self.assertEqual(len(structure['metrics']), 9)
+        self.assertEqual([sender['name'] for sender in structure['senders']][-3:],
+                         ['John Smith', 'Jane Doe', 'Bob Stone'])
+    
+    def test_scan_covers_whole_grid_while_a_metric_is_missing(self):
+        grid = _header_grid()
+        grid[2] = grid[2][:-1] + ['']
+        _, read_rows = _client()._build_sheet_structure(grid)
+        self.assertEqual(read_rows, tuple(range(len(grid))))
+    
+    def test_structure_cache_survives_writes_to_metric_rows(self):
+        grid = [
+            ['2025', '', ''],
+            ['Sender', '12/28/2024', '01/04/2025'],
+            ['John Smith', '', ''],
+            ['Connections Sent', '5', ''],
+            ['Messages Sent', '', ''],
+        ]
+        client = _client()
+        client.parse_sheet_structure('Weekly', all_values=grid)
+        cached = sheets_client._STRUCTURE_CACHE[(client.spreadsheet_id, 'Weekly')]
+        
+        # Weekly numbers land in metric label rows, which the scan never reads past the first cell
+        grid[3][2] = '7'
+        grid[4][1] = '3'
+        client.parse_sheet_structure('Weekly', all_values=grid)
+        self.assertIs(sheets_client._STRUCTURE_CACHE[(client.spreadsheet_id, 'Weekly')], cached)
+        
+        # A new sender row changes the first column, so the structure is parsed again
+        grid.append(['Jane Doe', '', ''])
+        structure = client.parse_sheet_structure('Weekly', all_values=grid)
+        self.assertIsNot(sheets_client._STRUCTURE_CACHE[(client.spreadsheet_id, 'Weekly')], cached)
+        self.assertEqual([sender['name'] for sender in structure['senders']][-2:], ['John Smith', 'Jane Doe'])
+
+
+if __name__ == '__main__':
+    unittest.main()